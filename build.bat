@@ -22,13 +22,13 @@ if not exist "venv\" (
 )
 
 REM Activate virtual environment
-echo [1/5] Activating virtual environment...
+echo [1/6] Activating virtual environment...
 call venv\Scripts\activate.bat
 
 REM Check for MinGit
 echo.
 
-echo [2/5] Checking for MinGit (portable Git)...
+echo [2/6] Checking for MinGit (portable Git)...
 
 if not exist "git_portable\" (
     echo.
@@ -51,25 +51,52 @@ if not exist "git_portable\" (
 REM Install/update dependencies
 echo.
 
-echo [3/5] Installing/updating dependencies...
+echo [3/6] Installing/updating dependencies...
 pip install -r requirements.txt --quiet
 
 REM Clean previous build
 echo.
 
-echo [4/5] Cleaning previous build...
+echo [4/6] Cleaning previous build...
 if exist "build\" rmdir /s /q build
 if exist "dist\" rmdir /s /q dist
 if exist "RagilmalikGitCloner.spec" del RagilmalikGitCloner.spec
+if exist "src\build\" rmdir /s /q src\build
+if exist "src\url_parser.*.pyd" del /q src\url_parser.*.pyd
+
+REM Compile the URL parser to a native module (optional)
+echo.
+
+echo [5/6] Compiling url_parser with mypyc (optional)...
+pip show mypy >nul 2>&1
+if errorlevel 1 (
+    echo [SKIP] mypy not installed - using the pure Python url_parser
+    echo To enable: pip install mypy
+) else (
+    pushd src
+    mypyc --ignore-missing-imports url_parser.py
+    if errorlevel 1 (
+        echo [WARNING] mypyc failed - using the pure Python url_parser
+        if exist "url_parser.*.pyd" del /q url_parser.*.pyd
+    ) else (
+        echo [OK] url_parser compiled
+    )
+    popd
+)
 
 REM Build executable
 echo.
 
-echo [5/5] Building portable executable...
+echo [6/6] Building portable executable...
 echo This may take 3-5 minutes...
 echo.
 pyinstaller build_exe.spec
 
+REM The compiled url_parser is only for the bundle - remove it so running
+REM from source (python src\main_gui.py) uses the editable url_parser.py
+if exist "src\build\" rmdir /s /q src\build
+if exist "src\url_parser.*.pyd" del /q src\url_parser.*.pyd
+
 REM Check if build succeeded
 if exist "dist\RagilmalikGitCloner\RagilmalikGitCloner.exe" (
     echo.
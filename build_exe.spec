@@ -39,6 +39,7 @@ a = Analysis(
         'url_parser',
         'git_operations',
         'report_generator',
+        'xlsx_writer',
         'error_handler',
         'git_config',
 
@@ -48,23 +49,10 @@ a = Analysis(
         'PIL',
         'PIL._tkinter_finder',
 
-        # Git operations
-        'git',
-        'git.exc',
-        'git.objects',
-        'git.objects.submodule',
-        'git.objects.submodule.base',
-        'git.objects.submodule.root',
-
         # File parsing
-        'pandas',
-        'pandas._libs',
-        'pandas._libs.tslibs',
         'openpyxl',
         'openpyxl.cell',
         'openpyxl.cell._writer',
-        'xlrd',
-        'numpy',  # Added to fix missing dependency
 
         # Standard library (explicit for safety)
         'csv',
@@ -73,6 +61,7 @@ a = Analysis(
         'datetime',
         'pathlib',
         'shutil',
+        'subprocess',
         'urllib',
         'urllib.request',
         'zipfile',
@@ -84,6 +73,8 @@ a = Analysis(
         # Exclude unnecessary packages to reduce size
         'matplotlib',
         'scipy',
+        'pandas',  # Reports and Excel input use openpyxl directly
+        'numpy',
         'PyQt5',
         'PyQt6',
         'PySide2',
@@ -6,7 +6,24 @@ Uses Pillow to generate a .ico file from scratch
 from PIL import Image, ImageDraw, ImageFont
 import os
 
+ICO_PATH = 'assets/icon.ico'
+PNG_PATH = 'assets/icon.png'
+ICO_SIZES = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
+
+def icon_is_current():
+    """True if both icon files exist and are newer than this script"""
+    source_mtime = os.path.getmtime(__file__)
+    return all(
+        os.path.exists(path) and os.path.getmtime(path) >= source_mtime
+        for path in (ICO_PATH, PNG_PATH)
+    )
+
 def create_icon():
+    # Skip the render on repeat builds
+    if icon_is_current():
+        print(f"Icon up to date: {ICO_PATH}")
+        return
+
     # Create a 256x256 image (standard for Windows icons)
     size = (256, 256)
     # Gradient background (Dark blue to purple)
@@ -40,12 +57,14 @@ def create_icon():
         os.makedirs('assets')
 
     # Save as PNG first
-    image.save('assets/icon.png')
+    image.save(PNG_PATH)
     
     # Save as ICO (containing multiple sizes for best scaling)
-    image.save('assets/icon.ico', format='ICO', sizes=[(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)])
+    # Pre-render each size with LANCZOS so small icons stay sharp
+    frames = [image if s == size else image.resize(s, Image.LANCZOS) for s in ICO_SIZES]
+    image.save(ICO_PATH, format='ICO', sizes=ICO_SIZES, append_images=frames[1:])
     
-    print("Icon created: assets/icon.ico")
+    print(f"Icon created: {ICO_PATH}")
 
 if __name__ == "__main__":
     create_icon()
\ No newline at end of file
@@ -5,62 +5,346 @@ Downloads and extracts portable Git (MinGit) for Windows
 Author: Ragilmalik
 """
 
+import hashlib
+import io
+import json
 import os
+import re
+import threading
+import time
 import urllib.request
 import zipfile
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import httpx
+except ImportError:
+    # build.bat runs this script before installing requirements
+    httpx = None
+
 # Configuration
 MINGIT_URL = "https://github.com/git-for-windows/git/releases/download/v2.43.0.windows.1/MinGit-2.43.0-64-bit.zip"
 OUTPUT_DIR = "git_portable"
-ZIP_NAME = "MinGit.zip"
+# Release notes of the MinGit version above; their checksum table lists
+# the SHA-256 of every asset
+RELEASE_API_URL = "https://api.github.com/repos/git-for-windows/git/releases/tags/v2.43.0.windows.1"
+# Pinned SHA-256 of the MinGit zip, copied from that checksum table.
+# While empty, the digest is read from the release notes at download time.
+# Either way nothing is extracted unless the download matches it.
+MINGIT_SHA256 = ""
+
+# Parallel download settings
+DOWNLOAD_WORKERS = 8
+READ_BUFFER = 1 << 20  # 1 MiB
+WRITE_BUFFER = 1 << 20  # 1 MiB - far fewer WriteFile calls than the 8 KiB default
+MAX_RETRIES = 5
+
+
+def open_client():
+    """
+    Create the pooled HTTP client shared by the probe, every range and every retry
+
+    Returns:
+        httpx.Client, or None when httpx isn't installed yet (urllib fallback)
+    """
+    if httpx is None:
+        return None
+    return httpx.Client(
+        follow_redirects=True,
+        timeout=60,
+        limits=httpx.Limits(max_connections=DOWNLOAD_WORKERS, max_keepalive_connections=DOWNLOAD_WORKERS)
+    )
+
+
+def probe_download(url, client=None):
+    """
+    Resolve redirects and read the download size with a HEAD request
+
+    Returns:
+        (final_url, content_length, accepts_ranges)
+    """
+    if client is not None:
+        response = client.head(url)
+        response.raise_for_status()
+        headers, final_url = response.headers, str(response.url)
+    else:
+        request = urllib.request.Request(url, method='HEAD')
+        with urllib.request.urlopen(request, timeout=30) as response:
+            headers, final_url = response.headers, response.geturl()
+
+    length = int(headers.get('Content-Length') or 0)
+    accepts_ranges = headers.get('Accept-Ranges', '').lower() == 'bytes'
+    return final_url, length, accepts_ranges
+
+
+def stream_range(url, start, end, client=None):
+    """Yield the bytes of [start, end] in READ_BUFFER sized chunks"""
+    headers = {'Range': f'bytes={start}-{end}'}
+
+    if client is not None:
+        with client.stream('GET', url, headers=headers) as response:
+            if response.status_code != 206:
+                raise IOError(f"Server ignored Range request (HTTP {response.status_code})")
+            yield from response.iter_bytes(READ_BUFFER)
+        return
+
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request, timeout=60) as response:
+        if response.status != 206:
+            raise IOError(f"Server ignored Range request (HTTP {response.status})")
+        while True:
+            chunk = response.read(READ_BUFFER)
+            if not chunk:
+                break
+            yield chunk
+
+
+def download_range(url, buffer, start, end, client=None):
+    """
+    Download bytes [start, end] straight into the shared pre-allocated buffer.
+    Workers own disjoint slices so no lock is needed.
+    Retries resume from the last received byte with exponential backoff.
+    """
+    view = memoryview(buffer)
+    offset = start
+    for attempt in range(MAX_RETRIES):
+        try:
+            for chunk in stream_range(url, offset, end, client):
+                if offset + len(chunk) > end + 1:
+                    raise IOError(f"Server sent more than range {start}-{end}")
+                view[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+            if offset != end + 1:
+                raise IOError(f"Incomplete range {start}-{end}: stopped at {offset}")
+            return
+        except Exception:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+
+def download_bytes(url):
+    """
+    Download url into memory using parallel HTTP Range requests.
+    Falls back to a single stream if the server doesn't support ranges.
+
+    Returns:
+        The downloaded content as bytes
+    """
+    client = open_client()
+    try:
+        final_url, length, accepts_ranges = probe_download(url, client)
+
+        if not accepts_ranges or length < DOWNLOAD_WORKERS * READ_BUFFER:
+            if client is not None:
+                response = client.get(final_url)
+                response.raise_for_status()
+                return response.content
+            with urllib.request.urlopen(final_url, timeout=60) as response:
+                return response.read()
+
+        # Pre-allocate the full buffer so workers can fill their own slices
+        buffer = bytearray(length)
+
+        part = -(-length // DOWNLOAD_WORKERS)
+        ranges = [(lo, min(lo + part, length) - 1) for lo in range(0, length, part)]
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = [executor.submit(download_range, final_url, buffer, lo, hi, client) for lo, hi in ranges]
+            for future in futures:
+                future.result()
+
+        return bytes(buffer)
+
+    finally:
+        if client is not None:
+            client.close()
+
+
+def verify_sha256(data, expected):
+    """
+    Check downloaded bytes against a pinned SHA-256 digest
+
+    hashlib hashes the whole buffer in one OpenSSL call (and drops the GIL
+    while doing it), so there is no Python-level chunk loop.
+
+    Returns:
+        (success, message)
+    """
+    actual = hashlib.sha256(data).hexdigest()
+    if actual != expected.lower():
+        return False, f"SHA-256 mismatch: expected {expected}, got {actual}"
+    return True, f"SHA-256 verified: {actual}"
+
+
+def fetch_published_sha256(filename):
+    """
+    Look up an asset's SHA-256 in the checksum table of the release notes
+
+    Returns:
+        The hex digest, or None if the notes don't list filename
+    """
+    headers = {'Accept': 'application/vnd.github+json'}
+    client = open_client()
+    try:
+        if client is not None:
+            response = client.get(RELEASE_API_URL, headers=headers)
+            response.raise_for_status()
+            release = response.json()
+        else:
+            request = urllib.request.Request(RELEASE_API_URL, headers=headers)
+            with urllib.request.urlopen(request, timeout=30) as response:
+                release = json.load(response)
+    finally:
+        if client is not None:
+            client.close()
+
+    # Table rows look like "MinGit-2.43.0-64-bit.zip | <sha-256>"
+    for line in (release.get('body') or '').splitlines():
+        cells = [cell.strip(' `*') for cell in line.split('|')]
+        if filename in cells:
+            for cell in cells:
+                if re.fullmatch(r'[0-9a-fA-F]{64}', cell):
+                    return cell.lower()
+    return None
+
+
+def member_path(name, output_dir):
+    """Resolve a zip member name inside output_dir, rejecting path traversal"""
+    root = os.path.realpath(output_dir)
+    target = os.path.realpath(os.path.join(root, name))
+    if os.path.commonpath([root, target]) != root:
+        raise IOError(f"Unsafe path in archive: {name}")
+    return target
+
+
+def write_member(zip_ref, info, target):
+    """
+    Write one zip member to target.
+    Where the OS supports it the file is first preallocated to its final
+    size, so the filesystem can lay it out in one contiguous extent.
+    Writes go through a 1 MiB buffer so each file costs a handful of
+    syscalls instead of one per 8 KiB.
+    """
+    fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+
+    if hasattr(os, 'posix_fallocate') and info.file_size:
+        try:
+            os.posix_fallocate(fd, 0, info.file_size)
+        except OSError:
+            # Not supported by this filesystem - just write normally
+            pass
+
+    with zip_ref.open(info) as source, open(fd, 'wb', buffering=WRITE_BUFFER) as dest:
+        shutil.copyfileobj(source, dest, length=WRITE_BUFFER)
+
+
+def extract_archive(data, output_dir):
+    """
+    Extract an in-memory zip with one thread per CPU.
+    zlib releases the GIL while inflating, so members decompress in parallel.
+    ZipFile isn't safe to share across threads, so each worker opens its own
+    over the same bytes.
+    """
+    with zipfile.ZipFile(io.BytesIO(data), 'r') as zip_ref:
+        members = zip_ref.infolist()
+
+    # Create the whole directory tree up front so workers never race on makedirs
+    directories = set()
+    for info in members:
+        target = member_path(info.filename, output_dir)
+        directories.add(target if info.is_dir() else os.path.dirname(target))
+    for directory in sorted(directories):
+        os.makedirs(directory, exist_ok=True)
+
+    local = threading.local()
+    opened = []
+
+    def extract_member(info):
+        zip_ref = getattr(local, 'zip_ref', None)
+        if zip_ref is None:
+            zip_ref = local.zip_ref = zipfile.ZipFile(io.BytesIO(data), 'r')
+            opened.append(zip_ref)
+        write_member(zip_ref, info, member_path(info.filename, output_dir))
+
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(extract_member, [info for info in members if not info.is_dir()]))
+    finally:
+        for zip_ref in opened:
+            zip_ref.close()
+
 
 def download_mingit():
-    """Download and extract MinGit"""
+    """
+    Download and extract MinGit
+
+    Returns:
+        True if MinGit is installed, False on any error
+    """
     
     print("RagilmalikGitCloner - MinGit Downloader")
     print("=" * 40)
 
-    # Create output directory
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
-        print(f"[+] Created directory: {OUTPUT_DIR}")
-    else:
-        print(f"[!] Directory exists: {OUTPUT_DIR} (skipping extraction if valid)")
-        if os.path.exists(os.path.join(OUTPUT_DIR, 'cmd', 'git.exe')):
-            print("[OK] MinGit already installed.")
-            return
+    if os.path.exists(os.path.join(OUTPUT_DIR, 'cmd', 'git.exe')):
+        print("[OK] MinGit already installed.")
+        return True
+
+    # Refuse to fetch an archive we can't verify
+    expected_sha256 = MINGIT_SHA256
+    if not expected_sha256:
+        filename = MINGIT_URL.rsplit('/', 1)[-1]
+        print("[-] Looking up the published SHA-256...")
+        try:
+            expected_sha256 = fetch_published_sha256(filename)
+        except Exception as e:
+            print(f"[ERROR] Could not read the release notes: {e}")
+            return False
+        if not expected_sha256:
+            print(f"[ERROR] The release notes list no SHA-256 for {filename}")
+            return False
+        print(f"[OK] Published SHA-256: {expected_sha256}")
 
     # Download
-    print(f"[-] Downloading MinGit from GitHub...")
+    print(f"[-] Downloading MinGit from GitHub ({DOWNLOAD_WORKERS} connections)...")
     try:
-        urllib.request.urlretrieve(MINGIT_URL, ZIP_NAME)
-        print("[OK] Download complete.")
+        data = download_bytes(MINGIT_URL)
+        print(f"[OK] Download complete ({len(data) // (1 << 20)} MB).")
     except Exception as e:
         print(f"[ERROR] Download failed: {e}")
-        return
+        return False
+
+    # Verify before anything is written to disk
+    verified, message = verify_sha256(data, expected_sha256)
+    if not verified:
+        print(f"[ERROR] {message}")
+        return False
+    print(f"[OK] {message}")
 
-    # Extract
+    # Create output directory only now: build.bat treats its existence as
+    # "MinGit present", so a failed download must not leave it behind
+    if not os.path.exists(OUTPUT_DIR):
+        os.makedirs(OUTPUT_DIR)
+        print(f"[+] Created directory: {OUTPUT_DIR}")
+    else:
+        print(f"[!] Directory exists: {OUTPUT_DIR} (MinGit incomplete, extracting again)")
+
+    # Extract straight from memory - the zip never touches the disk
     print("[-] Extracting files...")
     try:
-        with zipfile.ZipFile(ZIP_NAME, 'r') as zip_ref:
-            zip_ref.extractall(OUTPUT_DIR)
+        extract_archive(data, OUTPUT_DIR)
         print("[OK] Extraction complete.")
     except Exception as e:
         print(f"[ERROR] Extraction failed: {e}")
-        return
-
-    # Cleanup
-    print("[-] Cleaning up...")
-    try:
-        os.remove(ZIP_NAME)
-        print("[OK] Cleanup complete.")
-    except:
-        pass
+        return False
 
     print("\n[SUCCESS] MinGit is ready!")
     print(f"Location: {os.path.abspath(OUTPUT_DIR)}")
+    return True
 
 if __name__ == "__main__":
-    download_mingit()
\ No newline at end of file
+    # Non-zero exit so build.bat stops on a failed or unverified download
+    sys.exit(0 if download_mingit() else 1)
\ No newline at end of file
@@ -8,23 +8,37 @@ Author: Ragilmalik
 import os
 import sys
 import shutil
-from typing import Tuple, Optional
+import subprocess
+import functools
+from typing import Tuple, Optional, Dict
 
 
+# Don't flash a console window for every git call from the windowed .exe
+SUBPROCESS_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+
+
+@functools.lru_cache(maxsize=1)
 def is_git_installed() -> bool:
     """
     Check if git is installed on the system path
 
+    Cached for the lifetime of the process: if Git is installed while the
+    app is running, restart the app to pick it up.
+
     Returns:
         True if git command works, False otherwise
     """
     return shutil.which("git") is not None
 
 
+@functools.lru_cache(maxsize=1)
 def get_bundled_git_path() -> Optional[str]:
     """
     Get path to bundled MinGit if it exists
 
+    Cached for the lifetime of the process: the bundle doesn't move while
+    the app is running.
+
     Returns:
         Path to git.exe in bundled folder, or None if not found
     """
@@ -51,38 +65,104 @@ def get_bundled_git_path() -> Optional[str]:
     return None
 
 
-def get_git_executable() -> Tuple[str, str, bool]:
+# Cached result of _detect(): (git_path, source, is_valid)
+_probe: Optional[Tuple[str, str, bool]] = None
+
+
+def _detect() -> Tuple[str, str, bool]:
     """
-    Determine the best git executable to use
+    Probe for a git executable once per process and cache the answer
 
     Returns:
         (git_path, source, is_valid)
-        source: 'bundled', 'system', or 'none'
     """
+    global _probe
+
+    if _probe is not None:
+        return _probe
+
     # 1. Check for bundled MinGit (Priority for portability)
     bundled_path = get_bundled_git_path()
     if bundled_path:
-        return bundled_path, 'bundled', True
+        _probe = (bundled_path, 'bundled', True)
 
     # 2. Check for system Git
-    if is_git_installed():
-        return 'git', 'system', True
+    elif is_git_installed():
+        _probe = ('git', 'system', True)
 
     # 3. None found
-    return '', 'none', False
+    else:
+        _probe = ('', 'none', False)
+
+    return _probe
+
+
+def _invalidate_probe():
+    """Forget the cached probe so the next call looks for git again (for tests)"""
+    global _probe
+
+    _probe = None
+    get_bundled_git_path.cache_clear()
+    is_git_installed.cache_clear()
+
+
+def get_git_executable() -> Tuple[str, str, bool]:
+    """
+    Determine the best git executable to use
+
+    The probe runs once; later calls return the cached answer.
+
+    Returns:
+        (git_path, source, is_valid)
+        source: 'bundled', 'system', or 'none'
+    """
+    return _detect()
+
+
+def get_git_env() -> Dict[str, str]:
+    """
+    Environment for git subprocesses
+
+    Returns:
+        Copy of os.environ that makes git fail instead of waiting on a
+        credential prompt nobody can answer
+    """
+    return {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+
+
+def get_git_version(git_path: str) -> str:
+    """
+    Run 'git --version'
+
+    Args:
+        git_path: Git executable to run
+
+    Returns:
+        Version string, e.g. 'git version 2.43.0.windows.1'
+
+    Raises:
+        OSError or subprocess.SubprocessError if git can't be run
+    """
+    process = subprocess.run(
+        [git_path, '--version'],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=30,
+        creationflags=SUBPROCESS_FLAGS
+    )
+    return process.stdout.strip()
 
 
 def configure_git_environment():
     """
-    Configure GitPython to use the correct git executable
-    MUST be called before importing git or using GitPython
+    Configure the process environment for the selected git executable
+    MUST be called before running any git command
     """
     git_path, source, is_valid = get_git_executable()
 
     if is_valid and source == 'bundled':
-        # Set GIT_PYTHON_GIT_EXECUTABLE env var
-        os.environ['GIT_PYTHON_GIT_EXECUTABLE'] = git_path
-        # Add git cmd to PATH just in case
+        # Put git's cmd folder first on PATH so helpers resolve to the bundle
         git_dir = os.path.dirname(git_path)
         os.environ['PATH'] = git_dir + os.pathsep + os.environ['PATH']
         print(f"[Config] Using bundled Git: {git_path}")
@@ -101,19 +181,18 @@ def initialize_git() -> Tuple[bool, str]:
     """
     try:
         configure_git_environment()
-        
-        # Test import
-        import git
-        
+
+        git_path, source, is_valid = get_git_executable()
+        if not is_valid:
+            return False, "Git executable not found"
+
         # Test command execution
         try:
-            git.Git().version()
+            get_git_version(git_path)
             return True, "Git initialized successfully"
         except Exception as e:
             return False, f"Git executable found but failed to run: {e}"
 
-    except ImportError:
-        return False, "GitPython module not found"
     except Exception as e:
         return False, f"Git initialization failed: {e}"
 
@@ -133,8 +212,7 @@ def get_git_status_report() -> str:
     
     if is_valid:
         try:
-            import git
-            version = git.Git().version()
+            version = get_git_version(git_path)
             report.append(f"Git Version: {version}")
         except:
             report.append("Git Version: Unknown (Error execution)")
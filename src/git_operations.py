@@ -6,20 +6,37 @@ NOW WITH BUNDLED GIT SUPPORT AND ENHANCED ERROR HANDLING
 Author: Ragilmalik
 """
 
+import asyncio
 import os
 import re
+import stat
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Tuple, Any
+from typing import Dict, Tuple, Any, Iterator, List, Optional
 from pathlib import Path
 
 # Import our modules
-from git_config import initialize_git, get_git_executable
+from git_config import initialize_git, get_git_executable, get_git_env, SUBPROCESS_FLAGS
 from error_handler import ErrorFormatter
 
 
 # Initialize Git configuration (bundled or system)
 _git_initialized = False
 _git_init_message = ""
+_git_executable = "git"
+
+# GitHub owner/repo, with any .git suffix, trailing slash or extra path dropped
+_REPO_RE = re.compile(r'github\.com/([^/]+)/([^/?#]+?)(?:\.git)?(?:[/?#]|$)')
+
+# Serializes destination folder selection when clones run concurrently
+_destination_lock = threading.Lock()
+_reserved_paths = set()
+
+# Deletes failed clones in the background, off the caller's critical path
+_cleanup_executor = ThreadPoolExecutor(max_workers=1)
 
 
 def ensure_git_initialized() -> Tuple[bool, str]:
@@ -29,10 +46,12 @@ def ensure_git_initialized() -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    global _git_initialized, _git_init_message
+    global _git_initialized, _git_init_message, _git_executable
 
     if not _git_initialized:
         _git_initialized, _git_init_message = initialize_git()
+        if _git_initialized:
+            _git_executable = get_git_executable()[0]
 
     return _git_initialized, _git_init_message
 
@@ -51,12 +70,8 @@ def parse_repo_info(url: str) -> Tuple[str, str]:
         >>> parse_repo_info("https://github.com/torvalds/linux.git")
         ('torvalds', 'linux')
     """
-    # Remove .git suffix if present
-    url = url.replace('.git', '')
-
-    # Extract username and repo name using regex
-    pattern = r'github\.com/([^/]+)/([^/]+)'
-    match = re.search(pattern, url)
+    # Extract username and repo name (the pattern strips the .git suffix)
+    match = _REPO_RE.search(url)
 
     if match:
         username = match.group(1)
@@ -66,27 +81,215 @@ def parse_repo_info(url: str) -> Tuple[str, str]:
     return "unknown", "unknown"
 
 
-def calculate_repo_size(repo_path: str) -> float:
+def _run_git(args: List[str]) -> subprocess.CompletedProcess:
     """
-    Calculate total repository size in kilobytes (kB)
+    Run the configured git executable and capture its output
 
     Args:
-        repo_path: Path to cloned repository
+        args: Arguments passed after the git executable
 
     Returns:
-        Size in kB (kilobytes)
+        CompletedProcess with text stdout/stderr
+    """
+    return subprocess.run(
+        [_git_executable, *args],
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        env=get_git_env(),
+        creationflags=SUBPROCESS_FLAGS
+    )
+
+
+def classify_clone_error(error_msg: str, url: str, destination_folder: str) -> Tuple[str, str]:
+    """
+    Categorize git clone stderr into an error type and a formatted message
+
+    Args:
+        error_msg: stderr output of the failed clone
+        url: GitHub repository URL
+        destination_folder: Parent folder of the clone
+
+    Returns:
+        Tuple of (error_type, formatted_error)
+    """
+    lowered = error_msg.lower()
+
+    if 'not found' in lowered or '404' in error_msg or 'terminal prompts disabled' in lowered:
+        # Private repos surface as a disabled credential prompt
+        return 'repo_not_found', ErrorFormatter.format_error(
+            'repo_not_found',
+            repo_url=url
+        )
+
+    if 'timeout' in lowered or 'timed out' in lowered:
+        return 'network_error', ErrorFormatter.format_error(
+            'network_error',
+            cause='Connection timeout',
+            error=error_msg
+        )
+
+    if 'permission' in lowered or 'denied' in lowered:
+        return 'permission_error', ErrorFormatter.format_error(
+            'permission_error',
+            path=destination_folder,
+            error=error_msg
+        )
+
+    return 'clone_failed', ErrorFormatter.format_error(
+        'clone_failed',
+        repo_url=url,
+        error=error_msg
+    )
+
+
+def _rename_with_retry(source: str, target: str, attempts: int = 5):
     """
-    total_size = 0
+    Rename a freshly cloned folder into place
+
+    Retries briefly because on Windows an antivirus scan of the new files
+    can hold handles open for a moment, making the rename fail.
+    """
+    for attempt in range(attempts):
+        try:
+            os.rename(source, target)
+            return
+        except PermissionError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.2 * 2 ** attempt)
+
 
+def _fast_rmtree(path: str):
+    """
+    Best-effort recursive delete with an explicit scandir stack
+
+    Cheaper per entry than shutil.rmtree. Git marks pack files read-only,
+    which Windows refuses to unlink, so those get one retry after chmod.
+    """
+    stack = [path]
+    directories = []
+    while stack:
+        current = stack.pop()
+        directories.append(current)
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                    except PermissionError:
+                        try:
+                            os.chmod(entry.path, stat.S_IWRITE)
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+    for directory in reversed(directories):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass
+
+
+def _discard_staging(staging_path: str):
+    """
+    Get a failed clone out of the way immediately and delete it in the background
+
+    The rename is O(1); the recursive delete runs on _cleanup_executor.
+    """
+    if not os.path.exists(staging_path):
+        return
+
+    trash_path = staging_path + '.trash'
     try:
-        for dirpath, dirnames, filenames in os.walk(repo_path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
+        os.rename(staging_path, trash_path)
+    except OSError:
+        trash_path = staging_path
+
+    _cleanup_executor.submit(_fast_rmtree, trash_path)
+
+
+def _iter_file_sizes(path: str, skip_name: Optional[str] = None) -> Iterator[int]:
+    """
+    Yield the size of every regular file under path
+
+    Uses os.scandir so each size comes from the DirEntry instead of an
+    extra stat() on a rebuilt path string. Symlinks are not followed.
+    A top-level entry called skip_name is left out.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name == skip_name:
+                    continue
                 try:
-                    total_size += os.path.getsize(filepath)
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _iter_file_sizes(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry.stat(follow_symlinks=False).st_size
                 except OSError:
                     # Skip files that can't be accessed
                     pass
+    except OSError:
+        # Skip directories that can't be listed
+        pass
+
+
+def _iter_file_sizes_at(path: str, skip_name: Optional[str] = None) -> Iterator[int]:
+    """
+    Yield the size of every regular file under path using directory fds
+
+    os.fwalk hands out an fd per directory, so each file is stat'ed with
+    fstatat() relative to it instead of resolving a full path string.
+    POSIX only; symlinks are not followed. A top-level entry called
+    skip_name is left out.
+    """
+    for dirpath, dirnames, filenames, dir_fd in os.fwalk(path):
+        if dirpath == path and skip_name is not None:
+            if skip_name in dirnames:
+                dirnames.remove(skip_name)
+            filenames = [name for name in filenames if name != skip_name]
+
+        for filename in filenames:
+            try:
+                file_stat = os.stat(filename, dir_fd=dir_fd, follow_symlinks=False)
+            except OSError:
+                # Skip files that can't be accessed
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                yield file_stat.st_size
+
+
+# fwalk/dir_fd aren't available on Windows, which keeps the scandir walk
+_USE_FWALK = hasattr(os, 'fwalk') and os.stat in os.supports_dir_fd
+
+
+def calculate_repo_size(repo_path: str, include_git_dir: bool = True) -> float:
+    """
+    Calculate total repository size in kilobytes (kB)
+
+    Args:
+        repo_path: Path to cloned repository
+        include_git_dir: Also walk the .git folder (False = working tree only)
+
+    Returns:
+        Size in kB (kilobytes)
+    """
+    skip_name = None if include_git_dir else '.git'
+
+    try:
+        if _USE_FWALK:
+            total_size = sum(_iter_file_sizes_at(repo_path, skip_name))
+        else:
+            total_size = sum(_iter_file_sizes(repo_path, skip_name))
 
         # Convert bytes to kilobytes
         size_kb = total_size / 1024
@@ -98,31 +301,94 @@ def calculate_repo_size(repo_path: str) -> float:
         return 0.0
 
 
-def clone_repository(url: str, destination_folder: str) -> Dict[str, Any]:
+def get_git_objects_size(repo_path: str) -> Optional[float]:
     """
-    Clone a GitHub repository and gather metadata
+    Read the size of a repository's object store from git itself
 
-    NOW WITH BUNDLED GIT SUPPORT AND ENHANCED ERROR HANDLING!
+    `git count-objects -v` reports loose, packed and garbage sizes in kB
+    from git's own bookkeeping, without walking .git/objects.
 
     Args:
-        url: GitHub repository URL (with .git suffix)
-        destination_folder: Parent folder where repo will be cloned
+        repo_path: Path to cloned repository
 
     Returns:
-        Dictionary with clone results:
-        {
-            'success': bool,
-            'url': str,
-            'username': str,
-            'repo_name': str,
-            'size_kb': float,
-            'timestamp': str (DD-MM-YYYY HH:MM:SS),
-            'error': str or None,
-            'error_type': str or None (for error handling),
-            'repo_path': str
-        }
+        Size in kB, or None if git couldn't report it
+    """
+    try:
+        process = _run_git(['-C', repo_path, 'count-objects', '-v'])
+    except OSError:
+        return None
+
+    if process.returncode != 0:
+        return None
+
+    fields = dict(
+        line.split(': ', 1) for line in process.stdout.splitlines() if ': ' in line
+    )
+
+    try:
+        return float(
+            int(fields['size']) + int(fields['size-pack']) + int(fields.get('size-garbage', 0))
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+def get_pack_size(git_dir: str) -> Optional[float]:
     """
-    result = {
+    Size of a repository's pack files in kB
+
+    A fresh shallow clone stores (nearly) all objects in one or two packs,
+    so a handful of stat calls replace walking .git/objects.
+
+    Args:
+        git_dir: The .git folder (or the repo itself for bare clones)
+
+    Returns:
+        Size in kB, or None if there are no pack files (git creates the
+        pack folder even when every object is stored loose)
+    """
+    pack_dir = os.path.join(git_dir, 'objects', 'pack')
+    pack_bytes = 0
+    has_pack = False
+
+    try:
+        with os.scandir(pack_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    pack_bytes += entry.stat(follow_symlinks=False).st_size
+                    has_pack = has_pack or entry.name.endswith('.pack')
+    except OSError:
+        return None
+
+    return pack_bytes / 1024 if has_pack else None
+
+
+def measure_clone_size(repo_path: str, bare: bool = False) -> float:
+    """
+    Size of a fresh clone in kB: its pack files plus the working tree
+
+    Bare clones have no working tree, so only the objects count. Without
+    pack files (e.g. a local clone with loose objects) git's own count is
+    used, and failing that the whole folder is walked.
+    """
+    git_dir = repo_path if bare else os.path.join(repo_path, '.git')
+
+    objects_kb = get_pack_size(git_dir)
+    if objects_kb is None:
+        objects_kb = get_git_objects_size(repo_path)
+    if objects_kb is None:
+        return calculate_repo_size(repo_path)
+
+    if bare:
+        return round(objects_kb, 2)
+
+    return round(objects_kb + calculate_repo_size(repo_path, include_git_dir=False), 2)
+
+
+def _new_result(url: str) -> Dict[str, Any]:
+    """Empty clone result dictionary (see clone_repository)"""
+    return {
         'success': False,
         'url': url,
         'username': '',
@@ -134,133 +400,152 @@ def clone_repository(url: str, destination_folder: str) -> Dict[str, Any]:
         'repo_path': ''
     }
 
-    try:
-        # First, ensure Git is initialized
-        git_ok, git_message = ensure_git_initialized()
-        if not git_ok:
-            result['error'] = git_message
-            result['error_type'] = 'git_not_found'
-            return result
 
-        # Parse repository info
-        username, repo_name = parse_repo_info(url)
-        result['username'] = username
-        result['repo_name'] = repo_name
-
-        # Create destination path
-        repo_folder_name = repo_name.replace('.git', '')
-        repo_path = os.path.join(destination_folder, repo_folder_name)
-        
-        # Check if folder already exists and rename if necessary
-        if os.path.exists(repo_path):
+def _prepare_clone(result: Dict[str, Any], url: str, destination_folder: str, metadata_only: bool) -> str:
+    """
+    Fill in repo info, reserve the destination folder and create a staging folder
+
+    Returns:
+        Path of the empty staging folder to clone into
+    """
+    # Parse repository info
+    username, repo_name = parse_repo_info(url)
+    result['username'] = username
+    result['repo_name'] = repo_name
+
+    # Create destination path (bare clones get the conventional .git suffix)
+    folder_suffix = '.git' if metadata_only else ''
+    # parse_repo_info already dropped any .git suffix; names like
+    # user.github.io must be kept whole
+    repo_folder_name = repo_name
+    repo_path = os.path.join(destination_folder, repo_folder_name + folder_suffix)
+
+    with _destination_lock:
+        # Check if folder already exists (or is being cloned into) and rename if necessary
+        if os.path.exists(repo_path) or repo_path in _reserved_paths:
             # Generate timestamp for safe filename (no colons)
             timestamp_suffix = datetime.now().strftime("%d-%m-%Y_%H-%M")
-            new_folder_name = f"{repo_folder_name}_updated_{timestamp_suffix}"
+            base_folder_name = f"{repo_folder_name}_updated_{timestamp_suffix}"
+            new_folder_name = base_folder_name + folder_suffix
             repo_path = os.path.join(destination_folder, new_folder_name)
-            
+
+            # Same repo name cloned more than once within the minute
+            counter = 2
+            while os.path.exists(repo_path) or repo_path in _reserved_paths:
+                new_folder_name = f"{base_folder_name}_{counter}{folder_suffix}"
+                repo_path = os.path.join(destination_folder, new_folder_name)
+                counter += 1
+
             # Update repo_name for the report to indicate renaming
             # We keep the original repo name but append the new folder info
             result['repo_name'] = f"{repo_name} (Saved as: {new_folder_name})"
-            repo_folder_name = new_folder_name
-            
-        result['repo_path'] = repo_path
 
-        # Clone using GitPython
+        # Reserve the path so a concurrent clone of a same-named repo picks another
+        _reserved_paths.add(repo_path)
+
+    result['repo_path'] = repo_path
+
+    print(f"Cloning {url} to {os.path.basename(repo_path)}...")
+
+    # Clone into a staging folder on the same drive; it only gets its
+    # real name once the clone succeeded
+    return _make_staging_folder(destination_folder)
+
+
+def _make_staging_folder(destination_folder: str) -> str:
+    """
+    Create an empty, uniquely named staging folder in destination_folder
+
+    Unlike tempfile.mkdtemp (always mode 0700) this uses os.mkdir's default
+    mode, so once renamed into place the clone has normal permissions.
+    """
+    while True:
+        staging_path = os.path.join(destination_folder, f".clone-{os.urandom(4).hex()}")
         try:
-            from git import Repo
-            from git.exc import GitCommandError
+            os.mkdir(staging_path)
+            return staging_path
+        except FileExistsError:
+            continue
 
-            print(f"Cloning {url} to {repo_folder_name}...")
 
-            # Clone with depth=1 for faster cloning (shallow clone)
-            Repo.clone_from(url, repo_path, depth=1)
+def _release_destination(result: Dict[str, Any]):
+    """Drop the destination reservation taken by _prepare_clone"""
+    if result['repo_path']:
+        with _destination_lock:
+            _reserved_paths.discard(result['repo_path'])
 
-            # Calculate size
-            size_kb = calculate_repo_size(repo_path)
-            result['size_kb'] = size_kb
 
-            result['success'] = True
-            print(f"Successfully cloned {repo_name} ({size_kb} kB)")
+def _clone_args(metadata_only: bool) -> List[str]:
+    """
+    git arguments for a clone, before '-- <url> <path>'
 
-        except GitCommandError as git_error:
-            error_msg = str(git_error)
+    --quiet keeps git's "Cloning into '<staging folder>'..." line out of
+    stderr, which becomes the user-facing error; real errors still print.
+    """
+    if metadata_only:
+        # Bare, commit-only clone: trees and blobs are never downloaded
+        return ['clone', '--quiet', '--bare', '--filter=tree:0', '--depth=1']
 
-            # Categorize the error
-            if 'not found' in error_msg.lower() or '404' in error_msg:
-                result['error'] = ErrorFormatter.format_error(
-                    'repo_not_found',
-                    repo_url=url,
-                    username=username,
-                    repo_name=repo_name
-                )
-                result['error_type'] = 'repo_not_found'
+    # Shallow clone of the default branch only, without tags
+    return ['clone', '--quiet', '--depth=1', '--single-branch', '--no-tags']
 
-            elif 'timeout' in error_msg.lower():
-                result['error'] = ErrorFormatter.format_error(
-                    'network_error',
-                    cause='Connection timeout',
-                    error=error_msg
-                )
-                result['error_type'] = 'network_error'
 
-            elif 'permission' in error_msg.lower() or 'denied' in error_msg.lower():
-                result['error'] = ErrorFormatter.format_error(
-                    'permission_error',
-                    path=destination_folder,
-                    error=error_msg
-                )
-                result['error_type'] = 'permission_error'
+def _finish_clone(result: Dict[str, Any], returncode: int, stderr: str, staging_path: str,
+                  destination_folder: str, metadata_only: bool):
+    """Move a successful clone into place and measure it, or record why git failed"""
+    if returncode == 0:
+        repo_path = result['repo_path']
+        _rename_with_retry(staging_path, repo_path)
 
-            else:
-                result['error'] = ErrorFormatter.format_error(
-                    'clone_failed',
-                    repo_url=url,
-                    error=error_msg
-                )
-                result['error_type'] = 'clone_failed'
+        # Calculate size
+        size_kb = measure_clone_size(repo_path, bare=metadata_only)
+        result['size_kb'] = size_kb
 
-            print(f"Error: Clone failed - {error_msg}")
+        result['success'] = True
+        print(f"Successfully cloned {os.path.basename(repo_path)} ({size_kb} kB)")
 
-            # Clean up partial clone if exists
-            if os.path.exists(repo_path):
-                try:
-                    import shutil
-                    shutil.rmtree(repo_path)
-                except:
-                    pass
+    else:
+        error_msg = stderr.strip() or f"git exited with code {returncode}"
+        result['error_type'], result['error'] = classify_clone_error(
+            error_msg, result['url'], destination_folder
+        )
+        print(f"Error: Clone failed - {error_msg}")
 
-        except Exception as git_error:
-            error_msg = str(git_error)
+        # Throw away the partial clone
+        _discard_staging(staging_path)
 
-            # Generic Git error
-            result['error'] = ErrorFormatter.format_error(
-                'clone_failed',
-                repo_url=url,
-                error=error_msg
-            )
-            result['error_type'] = 'clone_failed'
-            print(f"Error: {error_msg}")
 
-            # Clean up partial clone if exists
-            if os.path.exists(repo_path):
-                try:
-                    import shutil
-                    shutil.rmtree(repo_path)
-                except:
-                    pass
+def _fail_clone(result: Dict[str, Any], git_error: Exception, staging_path: str):
+    """Record an exception raised while running git and discard the partial clone"""
+    error_msg = str(git_error)
+
+    # Generic Git error
+    result['error'] = ErrorFormatter.format_error(
+        'clone_failed',
+        repo_url=result['url'],
+        error=error_msg
+    )
+    result['error_type'] = 'clone_failed'
+    print(f"Error: {error_msg}")
+
+    # Throw away the partial clone
+    _discard_staging(staging_path)
 
-    except PermissionError as e:
+
+def _record_error(result: Dict[str, Any], error: Exception, destination_folder: str):
+    """Record an error raised outside of git itself (folders, disk, ...)"""
+    if isinstance(error, PermissionError):
         result['error'] = ErrorFormatter.format_error(
             'permission_error',
             path=destination_folder,
-            error=str(e)
+            error=str(error)
         )
         result['error_type'] = 'permission_error'
-        print(f"Error: Permission denied - {str(e)}")
+        print(f"Error: Permission denied - {str(error)}")
 
-    except OSError as e:
+    elif isinstance(error, OSError):
         # Could be disk space, network, etc.
-        error_msg = str(e)
+        error_msg = str(error)
 
         if 'space' in error_msg.lower():
             result['error'] = ErrorFormatter.format_error(
@@ -276,14 +561,178 @@ def clone_repository(url: str, destination_folder: str) -> Dict[str, Any]:
 
         print(f"Error: {error_msg}")
 
-    except Exception as e:
-        result['error'] = f"Unexpected error: {str(e)}"
+    else:
+        result['error'] = f"Unexpected error: {str(error)}"
         result['error_type'] = 'unexpected_error'
         print(f"Error: {result['error']}")
 
+
+def clone_repository(url: str, destination_folder: str, metadata_only: bool = False) -> Dict[str, Any]:
+    """
+    Clone a GitHub repository and gather metadata
+
+    NOW WITH BUNDLED GIT SUPPORT AND ENHANCED ERROR HANDLING!
+
+    Args:
+        url: GitHub repository URL (with .git suffix)
+        destination_folder: Parent folder where repo will be cloned
+        metadata_only: Make a bare, commit-only clone (<repo>.git, no
+            working tree) when only size/history metadata is needed
+
+    Returns:
+        Dictionary with clone results:
+        {
+            'success': bool,
+            'url': str,
+            'username': str,
+            'repo_name': str,
+            'size_kb': float,
+            'timestamp': str (DD-MM-YYYY HH:MM:SS),
+            'error': str or None,
+            'error_type': str or None (for error handling),
+            'repo_path': str
+        }
+    """
+    result = _new_result(url)
+
+    try:
+        # First, ensure Git is initialized
+        git_ok, git_message = ensure_git_initialized()
+        if not git_ok:
+            result['error'] = git_message
+            result['error_type'] = 'git_not_found'
+            return result
+
+        staging_path = _prepare_clone(result, url, destination_folder, metadata_only)
+
+        # Clone by invoking git directly (no GitPython wrapper layer)
+        try:
+            process = _run_git([*_clone_args(metadata_only), '--', url, staging_path])
+            _finish_clone(
+                result, process.returncode, process.stderr,
+                staging_path, destination_folder, metadata_only
+            )
+
+        except Exception as git_error:
+            _fail_clone(result, git_error, staging_path)
+
+    except Exception as e:
+        _record_error(result, e, destination_folder)
+
+    finally:
+        _release_destination(result)
+
     return result
 
 
+def clone_repositories(urls: List[str], destination_folder: str, max_workers: int = 8,
+                       metadata_only: bool = False) -> List[Dict[str, Any]]:
+    """
+    Clone several repositories concurrently
+
+    Cloning is network/subprocess bound, so threads overlap the waits.
+
+    Args:
+        urls: GitHub repository URLs (with .git suffix)
+        destination_folder: Parent folder where repos will be cloned
+        max_workers: Maximum number of simultaneous clones
+        metadata_only: Passed through to clone_repository
+
+    Returns:
+        List of clone result dictionaries, in the same order as urls
+    """
+    if not urls:
+        return []
+
+    # Initialize once up front - it mutates module globals and os.environ
+    ensure_git_initialized()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls), 32)) as executor:
+        futures = [
+            executor.submit(clone_repository, url, destination_folder, metadata_only)
+            for url in urls
+        ]
+        return [future.result() for future in futures]
+
+
+async def _clone_repository_async(url: str, destination_folder: str, semaphore: asyncio.Semaphore,
+                                  metadata_only: bool) -> Dict[str, Any]:
+    """
+    Async counterpart of clone_repository for a single URL
+
+    git runs through asyncio.create_subprocess_exec, so waiting on the
+    network doesn't hold a thread.
+    """
+    async with semaphore:
+        result = _new_result(url)
+
+        try:
+            staging_path = _prepare_clone(result, url, destination_folder, metadata_only)
+
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    _git_executable, *_clone_args(metadata_only), '--', url, staging_path,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=get_git_env(),
+                    creationflags=SUBPROCESS_FLAGS
+                )
+                _, stderr = await process.communicate()
+
+                # The rename and size walk block, so keep them off the event loop
+                await asyncio.to_thread(
+                    _finish_clone,
+                    result, process.returncode, stderr.decode('utf-8', errors='replace'),
+                    staging_path, destination_folder, metadata_only
+                )
+
+            except Exception as git_error:
+                _fail_clone(result, git_error, staging_path)
+
+        except Exception as e:
+            _record_error(result, e, destination_folder)
+
+        finally:
+            _release_destination(result)
+
+        return result
+
+
+async def clone_repositories_async(urls: List[str], destination_folder: str, max_concurrency: int = 16,
+                                   metadata_only: bool = False) -> List[Dict[str, Any]]:
+    """
+    Clone several repositories concurrently from a single event loop
+
+    Unlike clone_repositories this needs no thread per clone, so it scales
+    to large batches. Run it with:
+        results = asyncio.run(clone_repositories_async(urls, destination_folder))
+
+    Args:
+        urls: GitHub repository URLs (with .git suffix)
+        destination_folder: Parent folder where repos will be cloned
+        max_concurrency: Maximum number of simultaneous git processes
+        metadata_only: See clone_repository
+
+    Returns:
+        List of clone result dictionaries, in the same order as urls
+    """
+    if not urls:
+        return []
+
+    git_ok, git_message = ensure_git_initialized()
+    if not git_ok:
+        return [
+            {**_new_result(url), 'error': git_message, 'error_type': 'git_not_found'}
+            for url in urls
+        ]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(*(
+        _clone_repository_async(url, destination_folder, semaphore, metadata_only)
+        for url in urls
+    ))
+
+
 def clone_repository_with_progress(url: str, destination_folder: str, progress_callback=None) -> Dict[str, Any]:
     """
     Clone repository with progress updates
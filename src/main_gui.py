@@ -8,22 +8,29 @@ Version: 1.0.0
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-import threading
 import time
 import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List
 
 # Import our modules
-from url_parser import extract_urls_from_file, parse_manual_input
-from git_operations import clone_repository
-from report_generator import generate_report
+from url_parser import extract_urls_from_file, parse_manual_input, dedupe_urls
+from git_operations import clone_repository, ensure_git_initialized
+from report_generator import open_partial_report, append_partial_report, finalize_report
 
 
 # Modern Theme Configuration
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Status log size limit - the oldest lines are dropped in blocks
+LOG_MAX_LINES = 5000
+LOG_TRIM_LINES = 1000
+
 
 class RagilGitCloneApp(ctk.CTk):
     """Main application window with modern UI"""
@@ -43,13 +50,64 @@ class RagilGitCloneApp(ctk.CTk):
         self.selected_file_path = None
         self.selected_destination = None
         self.urls_to_clone = []
-        self.clone_results = []
         self.is_cloning = False
+
+        # The chosen file is parsed in the background as soon as it's picked
+        self._parse_executor = ThreadPoolExecutor(max_workers=1)
+        self._file_urls_future = None
+        self._file_signature = None  # (mtime, size) of the file when it was parsed
         self.stop_requested = False
+        self._report_path = None
+        self._partial_report = None  # (file, writer) results are appended to
+        self._clone_delay = 5
+        self._color_bucket = -1
+        self._progress_value = None
+        # The running batch's own copy of its inputs, so Clear or a new
+        # folder choice can't change it mid-batch
+        self._batch_urls = []
+        self._batch_total = 0
+        self._batch_destination = None
+        self._next_clone_index = 0  # next URL to hand to a worker
+        self._clones_in_flight = 0
+        self._clones_done = 0
+        self._pending_jobs = set()  # after() ids of workers waiting out the delay
+
+        # Log lines waiting for the next coalesced flush
+        self._log_buffer = deque()
+        self._log_flush_scheduled = False
+        self._log_clear_pending = False  # empty the widget on the next flush
+        self._ts_cache = (0, "")  # (epoch second, "HH:MM:SS")
+
+        # Progress bar colours (Red to Green), one per percent
+        self._progress_palette = [self.interpolate_color("#FF0000", "#00FF00", i / 100) for i in range(101)]
+
+        # UI updates posted by the clone worker, applied on the Tk thread
+        self._ui_q = queue.Queue()
+
+        # Debounced delay label updates, see update_delay_label
+        self._pending_delay = 5
+        self._delay_label_scheduled = False
+        self._delay_strings = [f"Clone Delay: {i} seconds" for i in range(1, 61)]
+
+        # Shared CTkFont instances, see _font
+        self._fonts = {}
 
         # Initialize UI
         self.create_widgets()
 
+        self.after(30, self._drain_ui_queue)
+
+        # Closing the window mid-batch stops the batch first
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def _font(self, **kwargs):
+        """Return a shared CTkFont for these options, creating it on first use"""
+        key = tuple(sorted(kwargs.items()))
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(**kwargs)
+        return font
+
     def create_widgets(self):
         """Create all UI components with modern styling and scrollable layout"""
         
@@ -77,8 +135,25 @@ class RagilGitCloneApp(ctk.CTk):
         )
         self.scroll_frame.pack(side="top", fill="both", expand=True, padx=20, pady=(10, 0))
 
-        # Add sections to scrollable area
-        
+        # The sections are built once the window shell is on screen, so the
+        # app appears without waiting for every widget. <Map> fires when the
+        # toplevel is shown; the after() hop lets Tk paint it first.
+        self._map_binding = self.bind("<Map>", self._on_first_map, add="+")
+
+    def _on_first_map(self, event):
+        """Schedule the section build the first time the window is mapped"""
+        # Child widgets' <Map> events also reach the toplevel's bindings
+        if event.widget is not self:
+            return
+        self.unbind("<Map>", self._map_binding)
+        self.after(1, self._build_remaining_sections)
+
+    def _build_remaining_sections(self):
+        """Add sections to scrollable area"""
+        # Sections are gridded into one column so Tk lays them out in one pass
+        self.scroll_frame.grid_columnconfigure(0, weight=1)
+        self._section_row = 0
+
         # File Input Section
         self.create_file_section(self.scroll_frame)
 
@@ -97,6 +172,11 @@ class RagilGitCloneApp(ctk.CTk):
         # Status Log Section
         self.create_log_section(self.scroll_frame)
 
+    def _place_section(self, section_frame, sticky="ew"):
+        """Grid a section frame into the next row of the scroll frame"""
+        section_frame.grid(row=self._section_row, column=0, sticky=sticky, pady=(0, 15))
+        self._section_row += 1
+
     def create_header(self, parent):
         """Create application header"""
         header_frame = ctk.CTkFrame(
@@ -110,7 +190,7 @@ class RagilGitCloneApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             header_frame,
             text="🚀 Ragilmalik Git Cloner",
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=self._font(size=32, weight="bold"),
             text_color="#FFFFFF"
         )
         title_label.pack(pady=(0, 5))
@@ -119,7 +199,7 @@ class RagilGitCloneApp(ctk.CTk):
         subtitle_label = ctk.CTkLabel(
             header_frame,
             text="Batch GitHub Repository Cloner with Smart Reporting",
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             text_color="#888888"
         )
         subtitle_label.pack()
@@ -133,13 +213,13 @@ class RagilGitCloneApp(ctk.CTk):
             border_width=1,
             border_color="#1E1E1E"
         )
-        section_frame.pack(fill="x", pady=(0, 15))
+        self._place_section(section_frame)
 
         # Section label
         label = ctk.CTkLabel(
             section_frame,
             text="📁 Import URLs from File",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(size=16, weight="bold"),
             text_color="#FFFFFF",
             anchor="w"
         )
@@ -159,7 +239,7 @@ class RagilGitCloneApp(ctk.CTk):
             corner_radius=10,
             fg_color="#1E90FF",
             hover_color="#1873CC",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             text_color="black"  # Black text
         )
         self.open_file_btn.pack(side="left", padx=(0, 10))
@@ -168,7 +248,7 @@ class RagilGitCloneApp(ctk.CTk):
         self.file_path_label = ctk.CTkLabel(
             file_container,
             text="No file selected",
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             text_color="#666666",
             anchor="w"
         )
@@ -183,13 +263,13 @@ class RagilGitCloneApp(ctk.CTk):
             border_width=1,
             border_color="#1E1E1E"
         )
-        section_frame.pack(fill="x", pady=(0, 15))
+        self._place_section(section_frame)
 
         # Section label
         label = ctk.CTkLabel(
             section_frame,
             text="✍️ Manual URL Input",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(size=16, weight="bold"),
             text_color="#FFFFFF",
             anchor="w"
         )
@@ -199,7 +279,7 @@ class RagilGitCloneApp(ctk.CTk):
         help_label = ctk.CTkLabel(
             section_frame,
             text="Enter GitHub URLs (one per line). .git suffix will be added automatically.",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color="#666666",
             anchor="w"
         )
@@ -213,7 +293,7 @@ class RagilGitCloneApp(ctk.CTk):
             fg_color="#0F0F0F",
             border_width=1,
             border_color="#2A2A2A",
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             text_color="#FFFFFF"
         )
         self.manual_urls_text.pack(fill="x", padx=20, pady=(0, 15))
@@ -227,13 +307,13 @@ class RagilGitCloneApp(ctk.CTk):
             border_width=1,
             border_color="#1E1E1E"
         )
-        section_frame.pack(fill="x", pady=(0, 15))
+        self._place_section(section_frame)
 
         # Section label
         label = ctk.CTkLabel(
             section_frame,
             text="📂 Destination Folder",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(size=16, weight="bold"),
             text_color="#FFFFFF",
             anchor="w"
         )
@@ -253,7 +333,7 @@ class RagilGitCloneApp(ctk.CTk):
             corner_radius=10,
             fg_color="#1E90FF",
             hover_color="#1873CC",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             text_color="black"  # Black text
         )
         self.choose_folder_btn.pack(side="left", padx=(0, 10))
@@ -262,7 +342,7 @@ class RagilGitCloneApp(ctk.CTk):
         self.folder_path_label = ctk.CTkLabel(
             folder_container,
             text="No folder selected",
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             text_color="#666666",
             anchor="w"
         )
@@ -277,13 +357,13 @@ class RagilGitCloneApp(ctk.CTk):
             border_width=1,
             border_color="#1E1E1E"
         )
-        section_frame.pack(fill="x", pady=(0, 15))
+        self._place_section(section_frame)
 
         # Section label
         label = ctk.CTkLabel(
             section_frame,
             text="⚙️ Settings",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(size=16, weight="bold"),
             text_color="#FFFFFF",
             anchor="w"
         )
@@ -300,7 +380,7 @@ class RagilGitCloneApp(ctk.CTk):
         self.delay_label = ctk.CTkLabel(
             delay_frame,
             text="Clone Delay: 5 seconds",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(size=13, weight="bold"),
             text_color="#FFFFFF",
             anchor="w"
         )
@@ -322,6 +402,31 @@ class RagilGitCloneApp(ctk.CTk):
         self.delay_slider.set(5)  # Default 5 seconds
         self.delay_slider.pack(fill="x")
 
+        self.workers_label = ctk.CTkLabel(
+            delay_frame,
+            text="Parallel Workers: 4",
+            font=self._font(size=13, weight="bold"),
+            text_color="#FFFFFF",
+            anchor="w"
+        )
+        self.workers_label.pack(fill="x", pady=(15, 8))
+
+        self.workers_slider = ctk.CTkSlider(
+            delay_frame,
+            from_=1,
+            to=8,
+            number_of_steps=7,
+            command=self.update_workers_label,
+            width=300,
+            height=20,
+            button_color="#00BCD4",
+            button_hover_color="#0097A7",
+            progress_color="#00BCD4",
+            fg_color="#2A2A2A"
+        )
+        self.workers_slider.set(4)  # Default 4 workers
+        self.workers_slider.pack(fill="x")
+
         # Right side - Report format
         report_frame = ctk.CTkFrame(settings_container, fg_color="transparent")
         report_frame.pack(side="left")
@@ -329,7 +434,7 @@ class RagilGitCloneApp(ctk.CTk):
         report_label = ctk.CTkLabel(
             report_frame,
             text="Report Format:",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(size=13, weight="bold"),
             text_color="#FFFFFF",
             anchor="w"
         )
@@ -346,7 +451,7 @@ class RagilGitCloneApp(ctk.CTk):
             text="XLSX",
             variable=self.report_format,
             value="xlsx",
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             text_color="#FFFFFF",
             fg_color="#00BCD4",
             hover_color="#0097A7"
@@ -358,7 +463,7 @@ class RagilGitCloneApp(ctk.CTk):
             text="CSV",
             variable=self.report_format,
             value="csv",
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             text_color="#FFFFFF",
             fg_color="#00BCD4",
             hover_color="#0097A7"
@@ -374,13 +479,13 @@ class RagilGitCloneApp(ctk.CTk):
             border_width=1,
             border_color="#1E1E1E"
         )
-        section_frame.pack(fill="x", pady=(0, 15))
+        self._place_section(section_frame)
 
         # Progress label
         self.progress_label = ctk.CTkLabel(
             section_frame,
             text="Ready to clone",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(size=13, weight="bold"),
             text_color="#FFFFFF",
             anchor="w"
         )
@@ -408,13 +513,14 @@ class RagilGitCloneApp(ctk.CTk):
             border_width=1,
             border_color="#1E1E1E"
         )
-        section_frame.pack(fill="both", expand=True, pady=(0, 15))
+        self.scroll_frame.grid_rowconfigure(self._section_row, weight=1)
+        self._place_section(section_frame, sticky="nsew")
 
         # Log label
         label = ctk.CTkLabel(
             section_frame,
             text="📋 Status Log",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(size=16, weight="bold"),
             text_color="#FFFFFF",
             anchor="w"
         )
@@ -428,25 +534,12 @@ class RagilGitCloneApp(ctk.CTk):
             fg_color="#0F0F0F",
             border_width=1,
             border_color="#2A2A2A",
-            font=ctk.CTkFont(size=12, family="Consolas"),
-            text_color="#00FFFF"  # Cyan
+            font=self._font(size=12, family="Consolas"),
+            text_color="#00FFFF",  # Cyan
+            state="disabled"  # Read-only; selection and Ctrl+C still work
         )
         self.log_text.pack(fill="both", expand=True, padx=20, pady=(0, 15))
 
-        # Make read-only but selectable
-        # We block all keys except Copy (Ctrl+C)
-        def prevent_write(event):
-            # Allow Ctrl+C (Copy)
-            if (event.state & 4) and event.keysym.lower() == 'c':
-                return None
-            # Allow arrow keys for navigation
-            if event.keysym in ('Up', 'Down', 'Left', 'Right', 'Home', 'End', 'Prior', 'Next'):
-                return None
-            # Block everything else
-            return "break"
-
-        self.log_text.bind("<Key>", prevent_write)
-
     def create_action_buttons(self, parent):
         """Create action buttons"""
         button_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -462,7 +555,7 @@ class RagilGitCloneApp(ctk.CTk):
             corner_radius=10,
             fg_color="#00BCD4",  # Cyan
             hover_color="#0097A7",  # Darker Cyan
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             text_color="black"  # Black text
         )
         self.start_btn.pack(side="left", padx=(0, 10))
@@ -477,7 +570,7 @@ class RagilGitCloneApp(ctk.CTk):
             corner_radius=10,
             fg_color="#FF3333",
             hover_color="#CC0000",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             text_color="#FFFFFF",
             state="disabled"
         )
@@ -493,7 +586,7 @@ class RagilGitCloneApp(ctk.CTk):
             corner_radius=10,
             fg_color="#666666",
             hover_color="#555555",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             text_color="#FFFFFF",
             anchor="center"  # Centered text
         )
@@ -516,8 +609,29 @@ class RagilGitCloneApp(ctk.CTk):
 
         if file_path:
             self.selected_file_path = file_path
-            self.file_path_label.configure(text=os.path.basename(file_path), text_color="#FFFFFF")
-            self.log_message(f"✓ File selected: {os.path.basename(file_path)}")
+
+            # Start parsing now so the URLs are ready by the time Start is pressed
+            self._parse_selected_file()
+
+            file_name = os.path.basename(file_path)
+            self.file_path_label.configure(text=file_name, text_color="#FFFFFF")
+            self.log_message(f"✓ File selected: {file_name}")
+
+    @staticmethod
+    def _stat_signature(file_path):
+        """(mtime, size) of a file, or None if it can't be read"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _parse_selected_file(self):
+        """(Re)start background parsing of the selected file"""
+        if self._file_urls_future is not None:
+            self._file_urls_future.cancel()
+        self._file_signature = self._stat_signature(self.selected_file_path)
+        self._file_urls_future = self._parse_executor.submit(extract_urls_from_file, self.selected_file_path)
 
     def choose_destination_folder(self):
         """Choose destination folder for cloned repositories"""
@@ -529,34 +643,119 @@ class RagilGitCloneApp(ctk.CTk):
             self.log_message(f"✓ Destination set: {folder_path}")
 
     def update_delay_label(self, value):
-        """Update delay label when slider moves"""
-        seconds = int(float(value))
-        self.delay_label.configure(text=f"Clone Delay: {seconds} seconds")
-
-    def log_message(self, message, color=None):
-        """Add message to status log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-
-        # We keep state="normal" so user can select text,
-        # but we prevented writing via key bindings.
-        self.log_text.insert("end", log_entry)
+        """
+        Update delay label when slider moves
+
+        A drag fires this for every step, so only the latest value is kept
+        and the label is redrawn at most once every 50 ms.
+        """
+        self._pending_delay = int(float(value))
+        if not self._delay_label_scheduled:
+            self._delay_label_scheduled = True
+            self.after(50, self._commit_delay_label)
+
+    def _commit_delay_label(self):
+        """Show the latest delay slider value"""
+        self._delay_label_scheduled = False
+        self.delay_label.configure(text=self._delay_strings[self._pending_delay - 1])
+
+    def update_workers_label(self, value):
+        """Update parallel workers label when slider moves"""
+        workers = int(float(value))
+        self.workers_label.configure(text=f"Parallel Workers: {workers}")
+
+    def log_message(self, message, color=None, flush=False):
+        """Add message to status log (see log_messages)"""
+        self.log_messages((message,), flush=flush)
+
+    def log_messages(self, messages, flush=False):
+        """
+        Add several messages to status log under one timestamp
+
+        Lines are buffered and written by one _flush_log call every 50 ms,
+        so a burst of messages costs a single insert and redraw.
+        Pass flush=True to write immediately (e.g. before a modal dialog).
+        """
+        # Timestamps only change once a second, so format each second once
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        timestamp = self._ts_cache[1]
+
+        self._log_buffer.extend(f"[{timestamp}] {message}\n" for message in messages)
+
+        if flush:
+            self._flush_log()
+        elif not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(50, self._flush_log)
+
+    def _flush_log(self):
+        """Write all buffered log lines in one insert"""
+        self._log_flush_scheduled = False
+        if not self._log_buffer:
+            return
+
+        lines = "".join(self._log_buffer)
+        self._log_buffer.clear()
+
+        # The log is disabled (read-only) except while we write to it
+        self.log_text.configure(state="normal")
+        if self._log_clear_pending:
+            self._log_clear_pending = False
+            self.log_text.delete("1.0", "end")
+        self.log_text.insert("end", lines)
+
+        # Keep the widget bounded so see("end") stays cheap on long batches
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{LOG_TRIM_LINES + 1}.0")
+
         self.log_text.see("end")
+        self.log_text.configure(state="disabled")
+
+    def _drain_ui_queue(self):
+        """
+        Apply UI updates posted by the clone worker
+
+        Tk isn't thread-safe, so the worker only puts (op, *args) tuples on
+        self._ui_q and every widget call happens here on the main thread.
+        """
+        try:
+            for _ in range(200):
+                try:
+                    op, *args = self._ui_q.get_nowait()
+                except queue.Empty:
+                    break
+
+                if op == "cloned":
+                    self._on_clone_finished(*args)
+        finally:
+            # Keep pumping even if one update failed
+            self.after(30, self._drain_ui_queue)
 
     def clear_all(self):
         """Clear all inputs and logs"""
+        if self.is_cloning:
+            return
+
         self.selected_file_path = None
         self.selected_destination = None
         self.urls_to_clone = []
-        self.clone_results = []
+
+        if self._file_urls_future is not None:
+            self._file_urls_future.cancel()
+            self._file_urls_future = None
+        self._file_signature = None
 
         self.file_path_label.configure(text="No file selected", text_color="#666666")
         self.folder_path_label.configure(text="No folder selected", text_color="#666666")
         self.manual_urls_text.delete("1.0", "end")
 
-        self.log_text.configure(state="normal")
-        self.log_text.delete("1.0", "end")
-        self.log_text.configure(state="disabled")
+        # Drop lines not yet written; the next flush empties the widget
+        # inside the same enable/disable pair as its insert
+        self._log_buffer.clear()
+        self._log_clear_pending = True
 
         self.progress_bar.set(0)
         self.progress_label.configure(text="Ready to clone")
@@ -570,8 +769,11 @@ class RagilGitCloneApp(ctk.CTk):
 
         # From file
         if self.selected_file_path:
+            # The file may have been edited since it was chosen
+            if self._stat_signature(self.selected_file_path) != self._file_signature:
+                self._parse_selected_file()
             try:
-                file_urls = extract_urls_from_file(self.selected_file_path)
+                file_urls = self._file_urls_future.result()
                 self.urls_to_clone.extend(file_urls)
                 self.log_message(f"✓ Extracted {len(file_urls)} URLs from file")
             except Exception as e:
@@ -584,8 +786,8 @@ class RagilGitCloneApp(ctk.CTk):
             self.urls_to_clone.extend(manual_urls)
             self.log_message(f"✓ Added {len(manual_urls)} URLs from manual input")
 
-        # Remove duplicates
-        self.urls_to_clone = list(set(self.urls_to_clone))
+        # Remove duplicates, keeping input order
+        self.urls_to_clone = dedupe_urls(self.urls_to_clone)
 
         # Validate
         if not self.urls_to_clone:
@@ -596,49 +798,97 @@ class RagilGitCloneApp(ctk.CTk):
             messagebox.showerror("Error", "Please select a destination folder!")
             return
 
-        # Start cloning in thread
+        # Set up Git once before any worker runs - it changes module
+        # globals and os.environ, which parallel clones must not race on
+        git_ok, git_message = ensure_git_initialized()
+        if not git_ok:
+            messagebox.showerror("Git Error", git_message)
+            return
+
+        # Results are appended to a partial CSV as clones finish, so they
+        # survive a crash and the final report is built from that file
+        timestamp = datetime.now().strftime("%d-%m-%Y_%H-%M")
+        self._report_path = os.path.join(self.selected_destination, f"Git_Clone_Batch_{timestamp}")
+        try:
+            self._partial_report = open_partial_report(self._report_path + ".partial.csv")
+        except OSError as e:
+            messagebox.showerror("Error", f"Cannot write the report to the destination folder!\n\n{e}")
+            return
+
+        # Start cloning
         self.is_cloning = True
         self.stop_requested = False
-        self.clone_results = []
 
         self.start_btn.configure(state="disabled")
         self.stop_btn.configure(state="normal")
+        self.clear_btn.configure(state="disabled")
+
+        self._batch_urls = list(self.urls_to_clone)
+        self._batch_total = len(self._batch_urls)
+        self._batch_destination = self.selected_destination
+
+        self.log_message(f"🚀 Starting batch clone of {self._batch_total} repositories...")
 
-        self.log_message(f"🚀 Starting batch clone of {len(self.urls_to_clone)} repositories...")
+        self._clone_delay = int(self.delay_slider.get())
+        workers = min(int(self.workers_slider.get()), self._batch_total)
+        self._next_clone_index = 0
+        self._clones_in_flight = 0
+        self._clones_done = 0
+        self._color_bucket = -1
+        self._progress_value = None
+        self._set_progress(0)
 
-        threading.Thread(target=self.clone_worker, daemon=True).start()
+        for _ in range(workers):
+            self._start_next_clone()
 
     def stop_cloning(self):
         """Stop the cloning process"""
         self.stop_requested = True
         self.stop_btn.configure(state="disabled")
 
-    def generate_final_report(self):
-        """Generate final report"""
-        if not self.clone_results:
-            return
+        # Workers waiting out the delay never start another clone;
+        # clones already running are allowed to finish
+        for job in self._pending_jobs:
+            self.after_cancel(job)
+        self._pending_jobs.clear()
+        self._finish_if_idle()
+
+    def on_close(self):
+        """Close the window, stopping a running batch first"""
+        if self.is_cloning:
+            # Clones still running are on daemon threads and won't keep
+            # the process alive; the partial report keeps what finished
+            self.stop_requested = True
+            for job in self._pending_jobs:
+                self.after_cancel(job)
+            self._pending_jobs.clear()
+            csvfile, _ = self._partial_report
+            csvfile.close()
+            self.is_cloning = False
+
+        self._parse_executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
 
+    def generate_final_report(self):
+        """Generate final report from the partial CSV written during the batch"""
         report_format = self.report_format.get()
-        timestamp = datetime.now().strftime("%d-%m-%Y_%H-%M")
-        report_name = f"Git_Clone_Batch_{timestamp}"
-
-        report_path = os.path.join(self.selected_destination, report_name)
+        partial_path = self._report_path + ".partial.csv"
 
-        success, message = generate_report(self.clone_results, report_path, report_format)
+        success, message = finalize_report(partial_path, self._report_path, report_format)
 
         if success:
-            self.log_message(f"✓ {message}")
+            self.log_message(f"✓ {message}", flush=True)
             messagebox.showinfo(
                 "Success",
                 f"Cloning completed!\n\n{message}"
             )
         else:
-            self.log_message(f"✗ Failed: {message}")
+            self.log_message(f"✗ Failed: {message}", flush=True)
             messagebox.showerror("Report Error", message)
 
 
     def interpolate_color(self, start_hex, end_hex, progress):
-        """Interpolate between two hex colors"""
+        """Interpolate between two hex colors (used to build _progress_palette)"""
         def hex_to_rgb(h):
             return tuple(int(h[i:i+2], 16) for i in (1, 3, 5))
 
@@ -654,63 +904,122 @@ class RagilGitCloneApp(ctk.CTk):
 
         return rgb_to_hex(r, g, b)
 
-    def clone_worker(self):
-        """Worker thread for cloning repositories"""
-        total = len(self.urls_to_clone)
-        delay = int(self.delay_slider.get())
-
-        # Colors for progress bar (Red to Green)
-        color_start = "#FF0000"
-        color_end = "#00FF00"
-
-        for index, url in enumerate(self.urls_to_clone, 1):
-            if self.stop_requested:
-                self.log_message("⏸️ Cloning stopped by user")
-                break
-
-            # Update progress
-            progress = (index - 1) / total
-            current_color = self.interpolate_color(color_start, color_end, progress)
-            self.progress_bar.configure(progress_color=current_color)
-            self.progress_bar.set(progress)
-            self.progress_label.configure(text=f"Cloning {index}/{total}: {url}")
-
-            # Clone repository
-            self.log_message(f"⏳ Cloning {url}...")
-            result = clone_repository(url, self.selected_destination)
-            self.clone_results.append(result)
-
-            if result['success']:
-                self.log_message(f"✓ Success: {result['repo_name']} ({result['size_kb']} kB)")
-            else:
-                self.log_message(f"✗ Failed: {result['error']}")
-
-            # Update progress
-            progress = index / total
-            current_color = self.interpolate_color(color_start, color_end, progress)
-            self.progress_bar.configure(progress_color=current_color)
-            self.progress_bar.set(progress)
-
-            # Delay before next clone
-            if index < total and not self.stop_requested:
-                self.log_message(f"⏰ Waiting {delay} seconds...")
-                time.sleep(delay)
-
-        # Finish
-        if not self.stop_requested:
-            self.progress_bar.set(1.0)
-            self.progress_bar.configure(progress_color=color_end) # Final green
-            self.progress_label.configure(text=f"✓ Completed {total} repositories")
-            self.log_message("=" * 50)
-            self.log_message(f"✓ Batch clone completed!")
-
-            # Generate report
+    def _set_progress(self, progress):
+        """
+        Move the progress bar
+
+        set() is a cheap fill redraw and runs once per distinct value.
+        Recolouring rebuilds the bar's colours, so it only happens when
+        progress crosses into one of 50 buckets.
+        """
+        if progress == self._progress_value:
+            return
+        self._progress_value = progress
+
+        bucket = int(progress * 50)
+        if bucket != self._color_bucket:
+            self._color_bucket = bucket
+            self.progress_bar.configure(progress_color=self._progress_palette[int(progress * 100)])
+        self.progress_bar.set(progress)
+
+    def _start_next_clone(self):
+        """
+        Start a clone of the next URL on its own daemon thread
+
+        Runs on the Tk thread. At most one clone runs per worker slot, so
+        the slider still bounds how many run at once. Each worker slot waits out the delay with an
+        after() timer rather than a sleeping thread, so Stop acts immediately.
+        """
+        total = self._batch_total
+        if self.stop_requested or self._next_clone_index >= total:
+            self._finish_if_idle()
+            return
+
+        index = self._next_clone_index
+        self._next_clone_index += 1
+        self._clones_in_flight += 1
+
+        url = self._batch_urls[index]
+        self.progress_label.configure(text=f"Cloning {index + 1}/{total}: {url}")
+        self.log_message(f"⏳ Cloning {url}...")
+
+        threading.Thread(
+            target=self.clone_worker,
+            args=(index, url, self._batch_destination),
+            daemon=True
+        ).start()
+
+    def clone_worker(self, index, url, destination):
+        """
+        Clone one repository on a worker thread
+
+        Never touches widgets directly - the result goes back through self._ui_q.
+        """
+        result = clone_repository(url, destination)
+
+        # Format the log line here so the Tk thread only has to insert it
+        if result['success']:
+            message = f"✓ Success: {result['repo_name']} ({result['size_kb']} kB)"
+        else:
+            message = f"✗ Failed: {result['error']}"
+
+        # One queue item per clone: the result travels with its log line
+        self._ui_q.put(("cloned", index, result, message))
+
+    def _on_clone_finished(self, index, result, message):
+        """Record a finished clone and give its worker slot the next URL after the delay"""
+        self._clones_in_flight -= 1
+        self._clones_done += 1
+        append_partial_report(*self._partial_report, result)
+
+        self._set_progress(self._clones_done / self._batch_total)
+
+        # Delay before next clone
+        if self._next_clone_index < self._batch_total and not self.stop_requested:
+            self.log_messages((message, f"⏰ Waiting {self._clone_delay} seconds..."))
+
+            def start_after_delay():
+                self._pending_jobs.discard(job)
+                self._start_next_clone()
+
+            job = self.after(self._clone_delay * 1000, start_after_delay)
+            self._pending_jobs.add(job)
+        else:
+            self.log_message(message)
+            self._finish_if_idle()
+
+    def _finish_if_idle(self):
+        """Wrap up the batch once no clone is running or waiting to start"""
+        if not self.is_cloning or self._clones_in_flight or self._pending_jobs:
+            return
+
+        if self.stop_requested:
+            self.log_message("⏸️ Cloning stopped by user")
+            self.finish_cloning(False)
+            return
+
+        total = self._batch_total
+        self._set_progress(1.0)  # Final green
+        self.progress_label.configure(text=f"✓ Completed {total} repositories")
+        self.log_message("=" * 50)
+        self.log_message("✓ Batch clone completed!")
+        self.finish_cloning(True)
+
+    def finish_cloning(self, completed):
+        """Generate the report (if the batch ran to the end) and reset the UI"""
+        csvfile, _ = self._partial_report
+        csvfile.close()
+
+        if completed:
             self.generate_final_report()
+        else:
+            self.log_message(f"✓ Partial report kept: {self._report_path}.partial.csv")
 
         # Reset UI
         self.is_cloning = False
         self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
+        self.clear_btn.configure(state="normal")
 
 
 
@@ -6,9 +6,68 @@ Author: Ragilmalik
 """
 
 import csv
-from typing import List, Dict, Tuple
+import os
+from typing import List, Dict, Tuple, IO, Any, Iterator
 from pathlib import Path
 
+from xlsx_writer import build_xlsx
+
+# Report column headers (exact order)
+REPORT_HEADERS = [
+    'Github Repository URL',
+    'Github Username',
+    'Github Repository Name',
+    'Repository Size (in kB)',
+    'Date & Time of Pull'
+]
+
+
+# Position of 'Repository Size (in kB)' in a report row
+SIZE_COLUMN = 3
+
+
+def _display_url(url: str) -> str:
+    """Drop the .git suffix normalize_url adds (only at the end of the URL)"""
+    return url[:-4] if url.endswith('.git') else url
+
+
+def report_row(item: Dict) -> Tuple:
+    """Turn one successful clone result into a report row (REPORT_HEADERS order)"""
+    return (
+        _display_url(item['url']),
+        # Keep raw formatting as requested - clone results already hold strings
+        item.get('username', ''),
+        item.get('repo_name', ''),
+        item['size_kb'],
+        item['timestamp']
+    )
+
+
+def _write_file_atomic(output_path: str, content: bytes) -> None:
+    """
+    Write content to output_path in one go via a temporary file
+
+    The old report stays intact until os.replace swaps the new one in, so
+    a failed write never leaves a truncated file behind.
+    """
+    temp_path = output_path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _iter_report_rows(data: List[Dict]) -> Iterator[Tuple]:
+    """Yield report rows for the successful clones in data, in order"""
+    for item in data:
+        if item.get('success', False):
+            yield report_row(item)
+
+
 def generate_xlsx_report(data: List[Dict], output_path: str) -> Tuple[bool, str]:
     """
     Generate Excel report of cloned repositories
@@ -16,88 +75,39 @@ def generate_xlsx_report(data: List[Dict], output_path: str) -> Tuple[bool, str]
     Returns:
         (success, message)
     """
-    try:
-        try:
-            import pandas as pd
-            from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-        except ImportError as e:
-            return False, f"Missing dependency: {str(e)}"
+    # Column widths need every row up front, so collect them
+    report_data = list(_iter_report_rows(data))
 
-        # Filter only successful clones
-        successful_clones = [item for item in data if item.get('success', False)]
+    if not report_data:
+        return False, "No successful clones to report"
+
+    return write_xlsx_rows(report_data, output_path)
 
-        if not successful_clones:
-            return False, "No successful clones to report"
 
-        # Prepare data for DataFrame
-        report_data = []
-        for item in successful_clones:
-            # Keep raw formatting as requested
-            username = str(item.get('username', ''))
-            repo_name = str(item.get('repo_name', ''))
-            # Remove .git from URL for display
-            clean_url = item['url'].replace('.git', '')
-            
-            report_data.append({
-                'Github Repository URL': clean_url,
-                'Github Username': username,
-                'Github Repository Name': repo_name,
-                'Repository Size (in kB)': item['size_kb'],
-                'Date & Time of Pull': item['timestamp']
-            })
-
-        # Create DataFrame
-        df = pd.DataFrame(report_data)
-
-        # Write to Excel with styling
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Clone Report', index=False)
-            
-            workbook = writer.book
-            worksheet = writer.sheets['Clone Report']
-
-            # Define Styles
-            # Table Theme: Dark Calm Gray
-            header_fill = PatternFill(start_color='1A1A1A', end_color='1A1A1A', fill_type='solid') # Darker Gray
-            row_fill_odd = PatternFill(start_color='2D2D2D', end_color='2D2D2D', fill_type='solid') # Dark Gray
-            row_fill_even = PatternFill(start_color='333333', end_color='333333', fill_type='solid') # Slightly Lighter
-            
-            header_font = Font(name='Segoe UI', size=12, bold=True, color='00FFFF') # Cyan Header Text
-            cell_font = Font(name='Segoe UI', size=11, color='FFFFFF') # White Cell Text
-            
-            thin_border = Border(
-                left=Side(style='thin', color='555555'),
-                right=Side(style='thin', color='555555'),
-                top=Side(style='thin', color='555555'),
-                bottom=Side(style='thin', color='555555')
-            )
-            
-            center_align = Alignment(horizontal='center', vertical='center')
-            left_align = Alignment(horizontal='left', vertical='center')
-
-            # Apply styles to Header
-            for cell in worksheet[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.border = thin_border
-                cell.alignment = center_align
-
-            # Apply styles to Rows
-            for row_idx, row in enumerate(worksheet.iter_rows(min_row=2), start=2):
-                fill = row_fill_even if row_idx % 2 == 0 else row_fill_odd
-                for cell in row:
-                    cell.fill = fill
-                    cell.font = cell_font
-                    cell.border = thin_border
-                    cell.alignment = left_align
-
-            # Auto-adjust column widths
-            for idx, col in enumerate(df.columns):
-                max_length = max(
-                    df[col].astype(str).map(len).max(),
-                    len(col)
-                ) + 4
-                worksheet.column_dimensions[chr(65 + idx)].width = min(max_length, 60)
+def write_xlsx_rows(report_data: List[Tuple], output_path: str) -> Tuple[bool, str]:
+    """
+    Write report rows (see report_row) to a styled Excel file
+
+    The report has a fixed shape and styling, so the workbook XML is
+    generated directly by xlsx_writer instead of going through openpyxl's
+    per-cell object model.
+
+    Returns:
+        (success, message)
+    """
+    try:
+        # Auto-adjust column widths, measuring every column in one pass
+        # (the sheet needs them before the first row is written)
+        widths = [len(col) for col in REPORT_HEADERS]
+        for row in report_data:
+            for idx, value in enumerate(row):
+                length = len(str(value))
+                if length > widths[idx]:
+                    widths[idx] = length
+        widths = [min(width + 4, 60) for width in widths]
+
+        content = build_xlsx(REPORT_HEADERS, report_data, widths, sheet_name='Clone Report')
+        _write_file_atomic(output_path, content)
 
         return True, f"XLSX report generated: {output_path}"
 
@@ -115,41 +125,24 @@ def generate_csv_report(data: List[Dict], output_path: str) -> Tuple[bool, str]:
         (success, message)
     """
     try:
-        # Filter only successful clones
-        successful_clones = [item for item in data if item.get('success', False)]
+        # Rows are streamed straight from data - only the first is pulled
+        # early to check there is anything to report
+        rows = _iter_report_rows(data)
+        first_row = next(rows, None)
 
-        if not successful_clones:
+        if first_row is None:
             return False, "No successful clones to report"
 
-        # Define column headers (exact order)
-        headers = [
-            'Github Repository URL',
-            'Github Username',
-            'Github Repository Name',
-            'Repository Size (in kB)',
-            'Date & Time of Pull'
-        ]
-
         # Write CSV file
         with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
+            writer = csv.writer(csvfile)
 
             # Write header
-            writer.writeheader()
+            writer.writerow(REPORT_HEADERS)
 
             # Write data rows
-            for item in successful_clones:
-                username = str(item.get('username', ''))
-                repo_name = str(item.get('repo_name', ''))
-                clean_url = item['url'].replace('.git', '')
-
-                writer.writerow({
-                    'Github Repository URL': clean_url,
-                    'Github Username': username,
-                    'Github Repository Name': repo_name,
-                    'Repository Size (in kB)': item['size_kb'],
-                    'Date & Time of Pull': item['timestamp']
-                })
+            writer.writerow(first_row)
+            writer.writerows(rows)
 
         return True, f"CSV report generated: {output_path}"
 
@@ -179,6 +172,83 @@ def generate_report(data: List[Dict], output_path: str, format_type: str = 'xlsx
         return False, f"Unknown format: {format_type}"
 
 
+def open_partial_report(partial_path: str) -> Tuple[IO[str], Any]:
+    """
+    Start a CSV that successful clones are appended to as they finish,
+    so nothing is lost if the app dies mid-batch
+
+    Returns:
+        (file, writer) - pass both to append_partial_report
+    """
+    csvfile = open(partial_path, 'w', newline='', encoding='utf-8')
+    writer = csv.writer(csvfile)
+    writer.writerow(REPORT_HEADERS)
+    csvfile.flush()
+    return csvfile, writer
+
+
+def append_partial_report(csvfile: IO[str], writer: Any, item: Dict) -> bool:
+    """
+    Append one clone result to the partial report (successful clones only)
+
+    Returns:
+        True if a row was written
+    """
+    if not item.get('success', False):
+        return False
+
+    writer.writerow(report_row(item))
+    csvfile.flush()
+    return True
+
+
+def finalize_report(partial_path: str, output_path: str, format_type: str = 'xlsx') -> Tuple[bool, str]:
+    """
+    Turn a partial CSV report into the final report
+
+    A CSV report is the partial file renamed into place; an XLSX report
+    is built from its rows. The partial file is removed on success.
+
+    Returns:
+        (success, message)
+    """
+    format_type = format_type.lower()
+    if format_type not in ('xlsx', 'csv'):
+        return False, f"Unknown format: {format_type}"
+
+    # Add appropriate extension
+    if not output_path.endswith('.' + format_type):
+        output_path += '.' + format_type
+
+    try:
+        with open(partial_path, 'r', newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            next(reader, None)  # Header
+            report_data = list(reader) if format_type == 'xlsx' else [next(reader, None)]
+
+        if not report_data or report_data[0] is None:
+            os.remove(partial_path)
+            return False, "No successful clones to report"
+
+        if format_type == 'csv':
+            os.replace(partial_path, output_path)
+            return True, f"CSV report generated: {output_path}"
+
+        # CSV stores everything as text - restore the numeric size column
+        for row in report_data:
+            row[SIZE_COLUMN] = float(row[SIZE_COLUMN])
+
+        success, message = write_xlsx_rows(report_data, output_path)
+        if success:
+            os.remove(partial_path)
+        return success, message
+
+    except PermissionError:
+        return False, f"Permission denied. Close '{output_path}' if open."
+    except Exception as e:
+        return False, f"Report Error: {str(e)}"
+
+
 # Testing
 if __name__ == "__main__":
     # Sample test data
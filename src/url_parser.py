@@ -6,19 +6,41 @@ Author: Ragilmalik
 """
 
 import re
-import csv
-from typing import List, Set
+import mmap
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 from pathlib import Path
 
 
 # GitHub URL regex pattern - matches both http and https
-GITHUB_URL_PATTERN = r'https?://github\.com/[\w\-\.]+/[/w\-\.]+'
+GITHUB_URL_PATTERN = r'https?://github\.com/[\w\-.]+/[\w\-.]+'
 
+# Compiled once at import.
+# Stays on the stdlib engine: re already skips ahead to the literal
+# 'http' prefix, and google-re2's Python wrapper was measured slower on
+# URL-dense files (per-match overhead) and can't scan an mmap.
+_URL_RE = re.compile(GITHUB_URL_PATTERN)
+_URL_RE_BYTES = re.compile(GITHUB_URL_PATTERN.encode('ascii'))
 
+_URL_SCHEMES = ('http://', 'https://')
+
+# Every match contains this literal; a plain find for it is much cheaper
+# than a regex scan and rules out files without any GitHub URL
+_GITHUB_HOST = 'github.com'
+_GITHUB_HOST_BYTES = _GITHUB_HOST.encode('ascii')
+# Longest text that can precede the host in a match ('https://')
+_HOST_OFFSET = len('https://')
+_VALID_RE = re.compile(r'^https?://github\.com/[\w\-.]+/[\w\-.]+(\.git)?$')
+
+
+@functools.lru_cache(maxsize=65536)
 def normalize_url(url: str) -> str:
     """
     Normalize GitHub URL to ensure it ends with .git
 
+    Cached, since the same URL tends to appear many times in one file.
+
     Args:
         url: GitHub repository URL
 
@@ -34,7 +56,7 @@ def normalize_url(url: str) -> str:
     url = url.strip()
 
     # Add https:// if missing
-    if not url.startswith(('http://', 'https://')):
+    if not url.startswith(_URL_SCHEMES):
         url = 'https://' + url
 
     # Remove trailing slash
@@ -57,8 +79,36 @@ def is_valid_github_url(url: str) -> bool:
     Returns:
         True if valid GitHub URL, False otherwise
     """
-    pattern = r'^https?://github\.com/[\w\-\.]+/[/w\-\.]+(\.git)?$' 
-    return bool(re.match(pattern, url))
+    return bool(_VALID_RE.match(url))
+
+
+def find_urls_in_file(filepath: str) -> List[str]:
+    """
+    Find raw GitHub URL matches in a file without reading it into memory
+
+    The file is memory-mapped and scanned as bytes, so no decoded copy of
+    the content is made. GitHub URLs are ASCII, so matches decode safely.
+
+    Args:
+        filepath: Path to any text-like file
+
+    Returns:
+        URL matches in file order (not normalized)
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return []
+
+        with mm:
+            first = mm.find(_GITHUB_HOST_BYTES)
+            if first == -1:
+                return []
+            # Start the regex scan just before the first possible match
+            start = max(0, first - _HOST_OFFSET)
+            return [match.decode('ascii') for match in _URL_RE_BYTES.findall(mm, start)]
 
 
 def parse_text_file(filepath: str) -> List[str]:
@@ -71,16 +121,11 @@ def parse_text_file(filepath: str) -> List[str]:
     Returns:
         List of normalized GitHub URLs
     """
-    urls = set()
+    urls: Dict[str, None] = {}  # dict keeps first-seen order while deduplicating
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         # Find all GitHub URLs
-        matches = re.findall(GITHUB_URL_PATTERN, content)
-        for match in matches:
-            urls.add(normalize_url(match))
+        urls = dict.fromkeys(map(normalize_url, find_urls_in_file(filepath)))
 
     except Exception as e:
         print(f"Error parsing text file: {e}")
@@ -92,34 +137,26 @@ def parse_csv_file(filepath: str) -> List[str]:
     """
     Extract GitHub URLs from CSV file (all columns)
 
+    Only the URLs matter, not the column structure, so the whole file is
+    scanned in one pass instead of cell by cell. A URL can't contain a
+    delimiter, so matches never cross cells.
+
     Args:
         filepath: Path to CSV file
 
     Returns:
         List of normalized GitHub URLs
     """
-    urls = set()
+    urls: Dict[str, None] = {}
 
     try:
         with open(filepath, 'r', encoding='utf-8', newline='') as f:
-            # Try to detect delimiter
-            sample = f.read(1024)
-            f.seek(0)
-
-            sniffer = csv.Sniffer()
-            try:
-                delimiter = sniffer.sniff(sample).delimiter
-            except:
-                delimiter = ','
-
-            reader = csv.reader(f, delimiter=delimiter)
+            content = f.read()
 
-            for row in reader:
-                for cell in row:
-                    # Search for GitHub URLs in each cell
-                    matches = re.findall(GITHUB_URL_PATTERN, str(cell))
-                    for match in matches:
-                        urls.add(normalize_url(match))
+        first = content.find(_GITHUB_HOST)
+        if first != -1:
+            start = max(0, first - _HOST_OFFSET)
+            urls = dict.fromkeys(map(normalize_url, _URL_RE.findall(content, start)))
 
     except Exception as e:
         print(f"Error parsing CSV file: {e}")
@@ -137,35 +174,36 @@ def parse_xlsx_file(filepath: str) -> List[str]:
     Returns:
         List of normalized GitHub URLs
     """
-    urls = set()
+    matches = []
 
     try:
-        import pandas as pd
-
-        # Read all sheets
-        excel_file = pd.ExcelFile(filepath)
-
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(filepath, sheet_name=sheet_name)
-
-            # Iterate through all cells
-            for column in df.columns:
-                for value in df[column].dropna():
-                    # Search for GitHub URLs
-                    matches = re.findall(GITHUB_URL_PATTERN, str(value))
-                    for match in matches:
-                        urls.add(normalize_url(match))
+        from openpyxl import load_workbook
+
+        # Stream raw cell values - no DataFrames or type inference needed
+        workbook = load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            for worksheet in workbook.worksheets:
+                for row in worksheet.iter_rows(values_only=True):
+                    # Search the whole row in one pass
+                    text = '\n'.join(str(value) for value in row if value is not None)
+                    if _GITHUB_HOST in text:
+                        matches.extend(_URL_RE.findall(text))
+        finally:
+            # read-only workbooks keep the file open until closed
+            workbook.close()
 
     except Exception as e:
         print(f"Error parsing XLSX file: {e}")
 
-    return list(urls)
+    # Deduplicate once at the end rather than merging a dict per row
+    return list(dict.fromkeys(map(normalize_url, matches)))
 
 
 def parse_markdown_file(filepath: str) -> List[str]:
     """
     Extract GitHub URLs from Markdown file
-    Extracts from both markdown links [text](url) and plain text URLs
+    One scan covers both markdown links [text](url) and plain text URLs,
+    since the plain pattern also matches the url inside a link
 
     Args:
         filepath: Path to Markdown file
@@ -173,22 +211,11 @@ def parse_markdown_file(filepath: str) -> List[str]:
     Returns:
         List of normalized GitHub URLs
     """
-    urls = set()
+    urls: Dict[str, None] = {}
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Extract URLs from markdown links: [text](url)
-        md_link_pattern = r'\[([^\]]+)\]\((' + GITHUB_URL_PATTERN + r')\)'
-        md_matches = re.findall(md_link_pattern, content)
-        for match in md_matches:
-            urls.add(normalize_url(match[1]))
-
-        # Extract plain text URLs
-        plain_matches = re.findall(GITHUB_URL_PATTERN, content)
-        for match in plain_matches:
-            urls.add(normalize_url(match))
+        # Extract plain text and linked URLs
+        urls = dict.fromkeys(map(normalize_url, find_urls_in_file(filepath)))
 
     except Exception as e:
         print(f"Error parsing Markdown file: {e}")
@@ -196,6 +223,18 @@ def parse_markdown_file(filepath: str) -> List[str]:
     return list(urls)
 
 
+# Parser for each supported file extension
+_DISPATCH = {
+    '.txt': parse_text_file,
+    '.log': parse_text_file,
+    '.csv': parse_csv_file,
+    '.xlsx': parse_xlsx_file,
+    '.xls': parse_xlsx_file,
+    '.md': parse_markdown_file,
+    '.markdown': parse_markdown_file,
+}
+
+
 def extract_urls_from_file(filepath: str) -> List[str]:
     """
     Auto-detect file format and extract GitHub URLs
@@ -206,21 +245,44 @@ def extract_urls_from_file(filepath: str) -> List[str]:
     Returns:
         List of normalized GitHub URLs
     """
-    path = Path(filepath)
-    extension = path.suffix.lower()
-
-    # Route to appropriate parser
-    if extension in ['.txt', '.log']:
-        return parse_text_file(filepath)
-    elif extension == '.csv':
-        return parse_csv_file(filepath)
-    elif extension in ['.xlsx', '.xls']:
-        return parse_xlsx_file(filepath)
-    elif extension in ['.md', '.markdown']:
-        return parse_markdown_file(filepath)
-    else:
-        # Try as text file for unknown extensions
-        return parse_text_file(filepath)
+    extension = Path(filepath).suffix.lower()
+
+    # Route to appropriate parser - try as text file for unknown extensions
+    return _DISPATCH.get(extension, parse_text_file)(filepath)
+
+
+def extract_urls_from_files(filepaths: List[str]) -> List[str]:
+    """
+    Extract GitHub URLs from several files at once
+
+    Files are parsed in parallel threads - reading and regex scanning both
+    release the GIL, so this scales with the disk rather than one core.
+
+    Args:
+        filepaths: Paths to files (any format extract_urls_from_file accepts)
+
+    Returns:
+        List of normalized GitHub URLs, deduplicated, in file order
+    """
+    if not filepaths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(32, len(filepaths))) as executor:
+        results = executor.map(extract_urls_from_file, filepaths)
+        return list(dict.fromkeys(url for urls in results for url in urls))
+
+
+def dedupe_urls(urls: List[str]) -> List[str]:
+    """
+    Remove duplicate URLs, keeping the first occurrence of each
+
+    Args:
+        urls: Normalized GitHub URLs
+
+    Returns:
+        URLs in input order without duplicates
+    """
+    return list(dict.fromkeys(urls))
 
 
 def parse_manual_input(text: str) -> List[str]:
@@ -233,23 +295,20 @@ def parse_manual_input(text: str) -> List[str]:
     Returns:
         List of normalized GitHub URLs
     """
-    urls = []
-
-    # Split by newlines and spaces
-    lines = text.strip().split('\n')
+    urls: Dict[str, None] = {}
 
-    for line in lines:
+    # splitlines also handles \r\n and \r without a stripped copy of the text
+    for line in text.splitlines():
         line = line.strip()
         if not line:
             continue
 
-        # Check if it looks like a GitHub URL
-        if 'github.com' in line.lower():
-            normalized = normalize_url(line)
-            if is_valid_github_url(normalized):
-                urls.append(normalized)
+        # The validity check is the GitHub URL check - no separate host scan
+        normalized = normalize_url(line)
+        if is_valid_github_url(normalized):
+            urls[normalized] = None
 
-    return urls
+    return list(urls)
 
 
 # Testing
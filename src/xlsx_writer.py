@@ -0,0 +1,194 @@
+"""
+RagilGitClone - XLSX Writer Module
+Writes the styled clone report straight to OOXML, without openpyxl
+
+Author: Ragilmalik
+"""
+
+import io
+import re
+import zipfile
+from typing import Iterable, List, Sequence
+from xml.sax.saxutils import escape
+
+# Cell style ids (positions in the cellXfs list of STYLES_XML)
+STYLE_HEADER = 1
+STYLE_ROW_ODD = 2
+STYLE_ROW_EVEN = 3
+
+# Control characters XML 1.0 can't hold (openpyxl rejects them as well)
+_ILLEGAL_XML_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{sheet_name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+# Table Theme: Dark Calm Gray
+# Header: Segoe UI 12 bold cyan on #1A1A1A, centered
+# Rows:   Segoe UI 11 white on #2D2D2D (odd) / #333333 (even), left aligned
+# All cells get a thin #555555 border
+_THIN = '<color rgb="00555555"/>'
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="3">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="12"/><color rgb="0000FFFF"/><name val="Segoe UI"/></font>'
+    '<font><sz val="11"/><color rgb="00FFFFFF"/><name val="Segoe UI"/></font>'
+    '</fonts>'
+    '<fills count="5">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="001A1A1A"/><bgColor rgb="001A1A1A"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="002D2D2D"/><bgColor rgb="002D2D2D"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="00333333"/><bgColor rgb="00333333"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="2">'
+    '<border><left/><right/><top/><bottom/><diagonal/></border>'
+    f'<border><left style="thin">{_THIN}</left><right style="thin">{_THIN}</right>'
+    f'<top style="thin">{_THIN}</top><bottom style="thin">{_THIN}</bottom><diagonal/></border>'
+    '</borders>'
+    '<cellStyleXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="2" fillId="3" borderId="1" applyAlignment="1">'
+    '<alignment horizontal="left" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="2" fillId="4" borderId="1" applyAlignment="1">'
+    '<alignment horizontal="left" vertical="center"/></xf>'
+    '</cellStyleXfs>'
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="1" applyFont="1" applyFill="1" '
+    'applyBorder="1" applyAlignment="1"><alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="2" fillId="3" borderId="1" xfId="2" applyFont="1" applyFill="1" '
+    'applyBorder="1" applyAlignment="1"><alignment horizontal="left" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="2" fillId="4" borderId="1" xfId="3" applyFont="1" applyFill="1" '
+    'applyBorder="1" applyAlignment="1"><alignment horizontal="left" vertical="center"/></xf>'
+    '</cellXfs>'
+    '<cellStyles count="4">'
+    '<cellStyle name="Normal" xfId="0" builtinId="0"/>'
+    '<cellStyle name="clone_header" xfId="1"/>'
+    '<cellStyle name="clone_row_odd" xfId="2"/>'
+    '<cellStyle name="clone_row_even" xfId="3"/>'
+    '</cellStyles>'
+    '</styleSheet>'
+)
+
+
+def column_letter(index: int) -> str:
+    """Convert a 1-based column index to its letter (1 -> 'A', 27 -> 'AA')"""
+    letters = ''
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cell_xml(ref: str, value, style: int) -> str:
+    """Render one cell - numbers as numeric cells, everything else as inline text"""
+    if value is None:
+        return ''
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if isinstance(value, float) and value.is_integer():
+            # Same as openpyxl: 3.0 is stored as 3
+            value = int(value)
+        return f'<c r="{ref}" s="{style}"><v>{value}</v></c>'
+
+    text = _ILLEGAL_XML_RE.sub('', str(value))
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<c r="{ref}" s="{style}" t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+
+
+def build_xlsx(headers: Sequence[str], rows: Iterable[Sequence], widths: List[float],
+               sheet_name: str = 'Sheet1') -> bytes:
+    """
+    Build a single-sheet report workbook in memory
+
+    The header row uses the header style and data rows alternate between
+    the even and odd row styles (the first data row is sheet row 2).
+    Rows are rendered straight into the zipped sheet as they are read.
+
+    Args:
+        headers: Column titles
+        rows: Row values, in header order
+        widths: Column widths, one per header
+        sheet_name: Worksheet tab name
+
+    Returns:
+        The .xlsx file contents
+    """
+    columns = [column_letter(idx) for idx in range(1, len(headers) + 1)]
+    buffer = io.BytesIO()
+
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES_XML)
+        archive.writestr('_rels/.rels', ROOT_RELS_XML)
+        archive.writestr('xl/workbook.xml', WORKBOOK_XML.format(sheet_name=escape(sheet_name, {'"': '&quot;'})))
+        archive.writestr('xl/_rels/workbook.xml.rels', WORKBOOK_RELS_XML)
+        archive.writestr('xl/styles.xml', STYLES_XML)
+
+        with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            cols = ''.join(
+                f'<col min="{idx}" max="{idx}" width="{width}" customWidth="1"/>'
+                for idx, width in enumerate(widths, start=1)
+            )
+            header = ''.join(
+                _cell_xml(f'{col}1', value, STYLE_HEADER) for col, value in zip(columns, headers)
+            )
+            sheet.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                f'<cols>{cols}</cols><sheetData><row r="1">{header}</row>'
+            ).encode('utf-8'))
+
+            for row_idx, row in enumerate(rows, start=2):
+                style = STYLE_ROW_EVEN if row_idx % 2 == 0 else STYLE_ROW_ODD
+                cells = ''.join(
+                    _cell_xml(f'{col}{row_idx}', value, style) for col, value in zip(columns, row)
+                )
+                sheet.write(f'<row r="{row_idx}">{cells}</row>'.encode('utf-8'))
+
+            sheet.write(b'</sheetData></worksheet>')
+
+    return buffer.getvalue()